@@ -2,49 +2,263 @@ from __future__ import annotations
 
 import base64
 import json
+import logging
 import re
-from collections import Counter
-from datetime import timedelta
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import field
+from functools import lru_cache, wraps
+from datetime import timedelta, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Any, Iterable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 from asus_router_client_exceptions import *
 from asus_router_models import *
 from asus_router_utils import *
 
+logger = logging.getLogger(__name__)
+
 ASUS_CLIENT_DEFAULT_HEADERS = {
-    "User-Agent": "asusrouter-Android-DUTUtil-1.0.0.245"
+    "User-Agent": "asusrouter-Android-DUTUtil-1.0.0.245",
+    "Connection": "keep-alive",
+}
+
+_AUTH_HEADERS = {
+    **ASUS_CLIENT_DEFAULT_HEADERS,
+    "Content-Type": "application/x-www-form-urlencoded"
 }
 
 DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_MAX_RETRIES = 2
+CAPS_CACHE_TTL = 300
+STATIC_NVRAMS_CACHE_TTL = 3600
+DEFAULT_MAX_WORKERS = 6
+
+_CPUTEMP_RE = re.compile(rb'(?<!\w)curr_cpuTemp\s*=\s*"?([^";]+)"?;')
+_MONTHS = {m: i for i, m in enumerate(("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1)}
+_NETDEV_KEY_RE = re.compile(r'^(?:(INTERNET|WIRELESS)(\d+)|(BRIDGE|WIRED))_(tx|rx)$')
+
+# Hardware identifiers and firmware version, which only change on a firmware upgrade
+_STATIC_INFO_NVRAMS = ("productid", "lan_hwaddr", "odmpid", "hardware_version", "bl_version", "firmver",
+                       "extendno", "territory_code", "serial_no")
+_INFO_NVRAMS = ("lan_hostname", "svc_ready", "qos_enable", "bwdpi_app_rulelist", "qos_type", "re_mode",
+                "webs_state_flag")
+_SW_MODE_NVRAMS = ("sw_mode", "wlc_psta", "wlc_express")
+_REBOOT_SCHEDULE_NVRAMS = ("reboot_schedule_enable", "reboot_schedule")
+_WIRELESS_NVRAMS = ("wps_enable", "wlc_band", "smart_connect_x")
+_DUAL_WAN_NVRAMS = ("wans_dualwan", "wan0_enable", "wan1_enable", "wans_mode")
+_DSL_NVRAMS = ("dsl0_proto", "dslx_transmode")
+_LAN_NVRAMS = ("lan_ipaddr", "lan_proto")
+_WIRELESS_BAND_NVRAM_SUFFIXES = ("mbo_enable", "ssid", "nmode_x", "auth_mode_x", "crypto", "mfp", "wep_x",
+                                 "closed", "hwaddr")
+# (sw_mode, wlc_psta, wlc_express) -> SwMode; None matches any value, anything unlisted is a router
+_SW_MODE_TABLE = {
+    # Repeater
+    (2, 0, 0): SwMode.RE,
+    (3, 2, 0): SwMode.RE,
+    # Access Point
+    (3, 0, None): SwMode.AP,
+    # Media Bridge
+    (3, 1, 0): SwMode.MB,
+    (3, 3, 0): SwMode.MB,
+    (2, 1, 0): SwMode.MB,
+    # ExpressWay 2G / 5G
+    (2, 0, 1): SwMode.EW2,
+    (2, 0, 2): SwMode.EW5,
+    # Hotspot
+    (5, None, None): SwMode.HS,
+}
+_WIFIBAND_MAP = WifiBand._value2member_map_
+_DUALWAN_MAP = DualWanOrigin._value2member_map_
+_WIFI_BAND_CAPS = (("2.4G", WifiUnit.WL_2G), ("5G", WifiUnit.WL_5G),
+                   ("5G-2", WifiUnit.WL_5G_2), ("wifi6e", WifiUnit.WL_6G))
+
+
+def _ttl_cache(ttl: float):
+    """
+    Cache the result of a no-argument RouterClient method in ``self._static_cache`` for ``ttl`` seconds.
+    A fresh client (e.g. after re-authentication) starts with an empty cache.
+    Refreshes are serialized on ``self._static_lock``, so concurrent callers share one request.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self):
+            cached = self._static_cache.get(name)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached[1]
+            with self._static_lock:
+                # another thread may have refreshed it while we waited
+                cached = self._static_cache.get(name)
+                if cached is not None and monotonic() - cached[0] < ttl:
+                    return cached[1]
+                value = method(self)
+                self._static_cache[name] = (monotonic(), value)
+                return value
+
+        return wrapper
+
+    return decorator
+
+
+def _is_word_byte(b: int) -> bool:
+    return b == 0x5F or 0x30 <= b <= 0x39 or 0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A
+
+
+def _parse_core_temp(payload: bytes) -> float:
+    # Fast path: the first "curr_cpuTemp = value;" statement, read with plain byte scans
+    # (the raw body is scanned as is, without decoding it to text first)
+    i = payload.find(b"curr_cpuTemp")
+    # the hit must be the whole name, not the tail of e.g. max_curr_cpuTemp
+    if i != -1 and (i == 0 or not _is_word_byte(payload[i - 1])):
+        j = payload.find(b"=", i) + 1
+        k = payload.find(b";", j)
+        if j and k != -1 and not payload[i + len(b"curr_cpuTemp"):j - 1].strip():
+            return float(payload[j:k].strip().strip(b'"'))
+    # The name is also part of another variable (or is missing): let the regex find the exact one
+    match = _CPUTEMP_RE.search(payload)
+    if match is None:
+        raise KeyError("curr_cpuTemp")
+    return float(match.group(1))
+
+
+@lru_cache(maxsize=8)
+def _offset_tz(raw: str) -> timezone:
+    # The router's offset only changes with DST, so the same few tzinfo objects are reused
+    offset = timedelta(hours=int(raw[1:3]), minutes=int(raw[3:5]))
+    return timezone(offset if raw[0] == "+" else -offset)
+
+
+def _parse_systime(s: str) -> datetime:
+    # Fast path for the fixed layout the router emits: "Mon, 04 Nov 2024 10:23:45 +0000"
+    if len(s) == 31 and s[3] == "," and s[26] in "+-":
+        try:
+            return datetime(int(s[12:16]), _MONTHS[s[8:11]], int(s[5:7]),
+                            int(s[17:19]), int(s[20:22]), int(s[23:25]),
+                            tzinfo=_offset_tz(s[26:31]))
+        except (KeyError, ValueError):
+            pass
+    systime = parsedate_to_datetime(s)
+    if systime.tzinfo is None:
+        # RFC 2822 "-0000" means UTC with unknown local offset; strptime treated it as UTC too
+        systime = systime.replace(tzinfo=timezone.utc)
+    return systime
+
+
+@lru_cache(maxsize=None)
+def _wireless_band_nvrams(wl_unit: WifiUnit, repeater: bool) -> tuple[str, ...]:
+    unit = f"{wl_unit.value}{'.1' if repeater else ''}"
+    return tuple(f"wl{unit}_{suffix}" for suffix in _WIRELESS_BAND_NVRAM_SUFFIXES)
+
+
+@lru_cache(maxsize=None)
+def _cpu_keys(cid: int) -> tuple[str, str]:
+    return f"cpu{cid}_usage", f"cpu{cid}_total"
+
+
+def _wan_nvrams(wan_index: int) -> tuple[str, ...]:
+    return (f"wan{wan_index}_state_t", f"wan{wan_index}_sbstate_t", f"wan{wan_index}_auxstate_t",
+            "link_internet", f"wan{wan_index}_ipaddr", f"wan{wan_index}_proto")
+
+
+@dataclass(frozen=True)
+class _NetdevLayout:
+    """Key names of a router's netdev payload, discovered once and then read by direct lookup."""
+    keys: frozenset[str]
+    internet_ids: tuple[int, ...]
+    internet_keys: tuple[tuple[str, str], ...]
+    wireless_ids: tuple[int, ...]
+    wireless_keys: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def scan(cls, netdev: dict[str, str]) -> _NetdevLayout:
+        ids: dict[str, set[int]] = {"INTERNET": set(), "WIRELESS": set()}
+        for key in netdev:
+            match = _NETDEV_KEY_RE.match(key)
+            if match is not None and match.group(1):
+                ids[match.group(1)].add(int(match.group(2)))
+        internet_ids = tuple(sorted(ids["INTERNET"]))
+        wireless_ids = tuple(sorted(ids["WIRELESS"]))
+        return cls(
+            keys=frozenset(netdev),
+            internet_ids=internet_ids,
+            internet_keys=tuple((f"INTERNET{i}_tx", f"INTERNET{i}_rx") for i in internet_ids),
+            wireless_ids=wireless_ids,
+            wireless_keys=tuple((f"WIRELESS{i}_tx", f"WIRELESS{i}_rx") for i in wireless_ids),
+        )
+
+    def read(self, netdev: dict[str, str]) -> NetdevInfo:
+        # netdev counters are always plain hex strings, so skip the parse_hex wrapper
+        return NetdevInfo(
+            bridge=ThroughputInfo(int(netdev["BRIDGE_tx"], 16), int(netdev["BRIDGE_rx"], 16)),
+            wired=ThroughputInfo(int(netdev["WIRED_tx"], 16), int(netdev["WIRED_rx"], 16)),
+            internet_ids=self.internet_ids,
+            internet=[ThroughputInfo(int(netdev[tx], 16), int(netdev[rx], 16)) for tx, rx in self.internet_keys],
+            wireless_ids=self.wireless_ids,
+            wireless=[ThroughputInfo(int(netdev[tx], 16), int(netdev[rx], 16)) for tx, rx in self.wireless_keys],
+        )
 
 
 @dataclass
 class RouterClient:
     host: str
     session: requests.Session
+    _static_cache: dict[str, tuple[float, Any]] = field(default_factory=dict, init=False, repr=False)
+    # reentrant: a cached method may call another cached method while refreshing
+    _static_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _netdev_layout: Optional[_NetdevLayout] = field(default=None, init=False, repr=False)
+    # Set once the firmware fails the combined snapshot hook, so snapshot() stops sending it
+    _split_snapshot: bool = field(default=False, init=False, repr=False)
+    _pool: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS),
+                                      init=False, repr=False)
+
+    def close(self) -> None:
+        """Stop the request pool and drop the session's keep-alive connections."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
 
     @staticmethod
-    def __handle_response(response: requests.Response) -> str:
+    def __check_error_status(data: Any) -> None:
+        if "error_status" in data:
+            # TODO: handle 2 (probable token expired), 10 (captcha is required) and other statuses
+            raise AuthenticationException()
+
+    @classmethod
+    def __check_response(cls, response: requests.Response) -> None:
         response.raise_for_status()
+        # Only pay for a JSON parse when the body can actually carry an error
+        if b"error_status" not in response.content:
+            return
         try:
-            data = response.json()
-            if "error_status" in data:
-                # TODO: handle 2 (probable token expired), 10 (captcha is required) and other statuses
-                raise AuthenticationException()
-        except json.decoder.JSONDecodeError:
-            pass
-        return response.text
+            data = _json.loads(response.content)
+        except ValueError:
+            return
+        cls.__check_error_status(data)
 
-    def __get_hook(self, name: str, args: str = "") -> str:
+    def __get_hook(self, name: str, args: str = "") -> bytes:
+        return self.__get_hooks(f"{name}({args})")
+
+    def __get_hooks(self, *calls: str) -> bytes:
         response = self.session.get(f"{self.host}/appGet.cgi",
                                     params={
-                                        "hook": f"{name}({args})"
+                                        "hook": ";".join(calls)
                                     },
-                                    headers=ASUS_CLIENT_DEFAULT_HEADERS,
                                     timeout=DEFAULT_TIMEOUT)
-        return self.__handle_response(response)
+        self.__check_response(response)
+        return response.content
 
     def __get_nvram(self, *nvrams: str):
         def __nvramget(*vars_: str) -> str:
@@ -54,30 +268,34 @@ class RouterClient:
                                     params={
                                         "hook": f"{__nvramget(*nvrams)})"
                                     },
-                                    headers=ASUS_CLIENT_DEFAULT_HEADERS,
                                     timeout=DEFAULT_TIMEOUT)
 
-        text = self.__handle_response(response)
-        return json.loads(text)
+        response.raise_for_status()
+        data = _json.loads(response.content)
+        self.__check_error_status(data)
+        return data
+
+    def get_all_nvrams(self, keys: Iterable[str]) -> dict[str, str]:
+        """Fetch every requested nvram variable in a single appGet.cgi round-trip."""
+        return self.__get_nvram(*dict.fromkeys(keys))
+
+    @_ttl_cache(STATIC_NVRAMS_CACHE_TTL)
+    def _static_nvrams(self) -> dict[str, str]:
+        return self.get_all_nvrams(_STATIC_INFO_NVRAMS)
 
     def get_core_temp(self) -> TemperatureInfo:
         response = self.session.get(f"{self.host}/ajax_coretmp.asp",
-                                    headers=ASUS_CLIENT_DEFAULT_HEADERS,
                                     timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
-        payload = response.text
-        pattern = re.compile(r'(\w+)\s*=\s*("?[^";]+"?);')
-        parsed = dict((m.group(1), m.group(2).strip('"')) for m in pattern.finditer(payload))
-
         return TemperatureInfo(
-            cpu=float(parsed["curr_cpuTemp"])
+            cpu=_parse_core_temp(response.content)
         )
 
     def get_uptime(self) -> UptimeInfo:
         response = self.__get_hook("uptime")
-        data = json.loads(response)
+        data = _json.loads(response)
         uptime_raw = data["uptime"].split("(")
-        systime = datetime.strptime(uptime_raw[0].strip(), "%a, %d %b %Y %H:%M:%S %z")
+        systime = _parse_systime(uptime_raw[0].strip())
         boottime = int(uptime_raw[1].split(" ")[0])
         return UptimeInfo(systime=systime, boottime=boottime)
 
@@ -96,45 +314,57 @@ class RouterClient:
         caps = self.get_supported_features()
         if not caps.is_supported("reboot_schedule"):
             return None
-        nvrams = self.__get_nvram("reboot_schedule_enable", "reboot_schedule")
+        nvrams = self.get_all_nvrams(_REBOOT_SCHEDULE_NVRAMS)
+        return self._compute_reboot_schedule(nvrams, self.get_uptime())
+
+    @classmethod
+    def _compute_reboot_schedule(cls, nvrams: dict[str, str], uptime: UptimeInfo) -> Optional[RebootScheduleInfo]:
         if not to_bool(nvrams.get("reboot_schedule_enable", "0")):
             return None
-        reboot_schedule = self._parse_schedule(nvrams["reboot_schedule"])
-        uptime = self.get_uptime()
+        reboot_schedule = cls._parse_schedule(nvrams["reboot_schedule"])
         systime = uptime.systime
-        for delta in range(8):
-            day_dt = systime + timedelta(days=delta)
-            if reboot_schedule.is_weekday_enabled(day_dt.weekday()):
-                candidate = reboot_schedule.set_time(day_dt)
-                if delta > 0 or candidate >= systime:
-                    until_ms = max(0, int((candidate - systime).total_seconds() * 1000))
-                    return RebootScheduleInfo(
-                        next_at=candidate,
-                        until_ms=until_ms,
-                        schedule=reboot_schedule
-                    )
-        return None
+        days = reboot_schedule.weekday_bits
+        # bit d is set when a reboot is scheduled `d` days from today (d = 7 is today next week)
+        upcoming = ((days | (days << 7)) >> systime.weekday()) & 0xFF
+        if reboot_schedule.set_time(systime) < systime:
+            upcoming &= ~1
+        if not upcoming:
+            return None
+        delta = (upcoming & -upcoming).bit_length() - 1
+        candidate = reboot_schedule.set_time(systime + timedelta(days=delta))
+        until_ms = max(0, int((candidate - systime).total_seconds() * 1000))
+        return RebootScheduleInfo(
+            next_at=candidate,
+            until_ms=until_ms,
+            schedule=reboot_schedule
+        )
 
     def get_cpu_usage(self) -> list[CpuInfo]:
         response = self.__get_hook("cpu_usage")
-        data = json.loads("{" + response[14:])
+        return self._parse_cpu_usage(_json.loads(b"{" + response[14:]))
+
+    @staticmethod
+    def _parse_cpu_usage(data: dict[str, str]) -> list[CpuInfo]:
         cpu_infos: list[CpuInfo] = []
 
         cpu_ids = ids_for("cpu", data.keys())
 
         for cid in cpu_ids:
-            prefix = f"cpu{cid}"
+            usage_key, total_key = _cpu_keys(cid)
 
             cpu_infos.append(CpuInfo(
-                usage=int(data[f"{prefix}_usage"]),
-                total=int(data[f"{prefix}_total"])
+                usage=int(data[usage_key]),
+                total=int(data[total_key])
             ))
 
         return cpu_infos
 
     def get_memory_usage(self) -> MemoryInfo:
         response = self.__get_hook("memory_usage")
-        data = json.loads("{" + response[17:])
+        return self._parse_memory_usage(_json.loads(b"{" + response[17:]))
+
+    @staticmethod
+    def _parse_memory_usage(data: dict[str, str]) -> MemoryInfo:
         return MemoryInfo(
             total_kb=int(data["mem_total"]),
             used_kb=int(data["mem_used"]),
@@ -143,80 +373,94 @@ class RouterClient:
 
     def get_wl_nband_info(self) -> dict[WifiBand, int]:
         response = self.__get_hook("wl_nband_info")
-        wl_nband_info = json.loads(response)["wl_nband_info"]
-        wl_nband_array = [int(v) for v in wl_nband_info]
-        counts = Counter(wl_nband_array)
-
-        return {
-            band: counts.get(band.value, 0)
-            for band in WifiBand
-        }
+        wl_nband_info = _json.loads(response)["wl_nband_info"]
+        counts = {band: 0 for band in WifiBand}
+        for v in wl_nband_info:
+            band = _WIFIBAND_MAP.get(int(v))
+            if band is not None:
+                counts[band] += 1
+        return counts
 
     def get_plugged_usb_devices(self) -> list[UsbDeviceType]:
         response = self.__get_hook("show_usb_path")
-        all_usb_statuses = json.loads(response)["show_usb_path"]
+        all_usb_statuses = _json.loads(response)["show_usb_path"]
         usb_devices = []
         for usb_status in all_usb_statuses:
             usb_devices.append(UsbDeviceType(usb_status))
         return usb_devices
 
-    def get_wireless_band_info(self, wl_unit: WifiUnit, repeater:bool) -> WifiBandInfo:
-        unit = f"{wl_unit.value}{'.1' if repeater else ''}"
-        nvrams = self.__get_nvram(f"wl{unit}_mbo_enable", f"wl{unit}_ssid", f"wl{unit}_nmode_x",
-                                  f"wl{unit}_auth_mode_x", f"wl{unit}_crypto", f"wl{unit}_mfp",
-                                  f"wl{unit}_wep_x", f"wl{unit}_closed", f"wl{unit}_hwaddr")
+    def get_wireless_band_info(self, wl_unit: WifiUnit, repeater: bool) -> WifiBandInfo:
+        nvrams = self.get_all_nvrams(_wireless_band_nvrams(wl_unit, repeater))
+        return self._compute_wireless_band_info(nvrams, wl_unit, repeater)
+
+    @staticmethod
+    def _compute_wireless_band_info(nvrams: dict[str, str], wl_unit: WifiUnit, repeater: bool) -> WifiBandInfo:
+        mbo_enable, ssid, nmode, auth_mode, crypto, mfp, wep, closed, hwaddr = _wireless_band_nvrams(wl_unit, repeater)
         return WifiBandInfo(
-            ssid=nvrams[f"wl{unit}_ssid"],
-            mac=nvrams[f"wl{unit}_hwaddr"],
-            mode=WifiMode(int(nvrams[f"wl{unit}_nmode_x"])),
-            auth_mode=WifiAuthMode(nvrams[f"wl{unit}_auth_mode_x"]),
-            crypto=WifiCrypto(nvrams[f"wl{unit}_crypto"]),
-            mfp=WifiMfp(int(nvrams[f"wl{unit}_mfp"])),
-            wep=WifiWpsWep(int(nvrams[f"wl{unit}_wep_x"])),
-            hidde_ssid=to_bool(nvrams[f"wl{unit}_closed"]),
-            mbo_enabled=to_bool(nvrams.get(f"wl{unit}_mbo_enable", "0"))
+            ssid=nvrams[ssid],
+            mac=nvrams[hwaddr],
+            mode=WifiMode(int(nvrams[nmode])),
+            auth_mode=WifiAuthMode(nvrams[auth_mode]),
+            crypto=WifiCrypto(nvrams[crypto]),
+            mfp=WifiMfp(int(nvrams[mfp])),
+            wep=WifiWpsWep(int(nvrams[wep])),
+            hidde_ssid=to_bool(nvrams[closed]),
+            mbo_enabled=to_bool(nvrams.get(mbo_enable, "0"))
         )
 
-
     def get_wireless_info(self) -> WifiInfo:
-        wl_nband_info = self.get_wl_nband_info()
-        nvrams = self.__get_nvram("wps_enable", "wlc_band", "smart_connect_x")
+        f_wl = self._pool.submit(self.get_wl_nband_info)
+        caps = self.get_supported_features()
+
+        # The unit prefix depends on sw_mode, so prefetch both variants of every supported band
+        keys = [*_WIRELESS_NVRAMS, *_SW_MODE_NVRAMS]
+        for cap, wl_unit in _WIFI_BAND_CAPS:
+            if caps.is_supported(cap):
+                keys.extend(_wireless_band_nvrams(wl_unit, False))
+                keys.extend(_wireless_band_nvrams(wl_unit, True))
+        nvrams = self.get_all_nvrams(keys)
+
         wifi_info = WifiInfo(
-            bands_count=wl_nband_info,
+            bands_count=f_wl.result(),
             wps_enabled=to_bool(nvrams.get("wps_enable", "0")),
             smart_connect_enabled=to_bool(nvrams.get("smart_connect_enable", "0")),
         )
 
-        caps = self.get_supported_features()
-        sw_mode = self.get_sw_mode()
+        sw_mode = self._compute_sw_mode(nvrams)
         wlc_band = nvrams[f"wlc_band"]
         concurrep_support = caps.is_supported("concurrep")
         if caps.is_supported("2.4G"):
             repeater = sw_mode == SwMode.RE and (concurrep_support or wlc_band == str(WifiUnit.WL_2G))
-            wifi_info.band_2G_info = self.get_wireless_band_info(WifiUnit.WL_2G, repeater)
+            wifi_info.band_2G_info = self._compute_wireless_band_info(nvrams, WifiUnit.WL_2G, repeater)
         if caps.is_supported("5G"):
             repeater = sw_mode == SwMode.RE and (concurrep_support or wlc_band == str(WifiUnit.WL_5G))
-            wifi_info.band_5G_info = self.get_wireless_band_info(WifiUnit.WL_5G, repeater)
+            wifi_info.band_5G_info = self._compute_wireless_band_info(nvrams, WifiUnit.WL_5G, repeater)
         if caps.is_supported("5G-2"):
             repeater = sw_mode == SwMode.RE and (concurrep_support or wlc_band == str(WifiUnit.WL_5G_2))
-            wifi_info.band_5G_2_info = self.get_wireless_band_info(WifiUnit.WL_5G_2, repeater)
+            wifi_info.band_5G_2_info = self._compute_wireless_band_info(nvrams, WifiUnit.WL_5G_2, repeater)
         if caps.is_supported("wifi6e"):
             repeater = sw_mode == SwMode.RE and (concurrep_support or wlc_band == str(WifiUnit.WL_6G))
-            wifi_info.band_6G_info = self.get_wireless_band_info(WifiUnit.WL_6G, repeater)
+            wifi_info.band_6G_info = self._compute_wireless_band_info(nvrams, WifiUnit.WL_6G, repeater)
 
         return wifi_info
 
     def get_info(self) -> RouterInfo:
-        nvrams = self.__get_nvram("productid", "lan_hwaddr", "lan_hostname", "odmpid", "hardware_version",
-                                  "bl_version", "svc_ready", "qos_enable", "bwdpi_app_rulelist", "qos_type", "firmver",
-                                  "extendno", "territory_code", "re_mode", "serial_no", "webs_state_flag")
+        f_caps = self._pool.submit(self.get_supported_features)
+        f_uptime = self._pool.submit(self.get_uptime)
+        static_nvrams = self._static_nvrams()
+        f_ports = self._pool.submit(self.get_port_status_infos, static_nvrams["lan_hwaddr"])
+        nvrams = {
+            **static_nvrams,
+            **self.get_all_nvrams((*_INFO_NVRAMS, *_SW_MODE_NVRAMS, *_REBOOT_SCHEDULE_NVRAMS)),
+        }
 
-        sw_mode = self.get_sw_mode()
-        caps = self.get_supported_features()
-        uptime = self.get_uptime()
-        reboot_schedule = self.get_reboot_schedule_time()
+        sw_mode = self._compute_sw_mode(nvrams)
+        caps = f_caps.result()
+        uptime = f_uptime.result()
+        reboot_schedule = (self._compute_reboot_schedule(nvrams, uptime)
+                           if caps.is_supported("reboot_schedule") else None)
         software_update_available = nvrams["webs_state_flag"] in ["1", "2"]
-        ports_info = self.get_port_status_infos(nvrams["lan_hwaddr"])
+        ports_info = f_ports.result()
 
         return RouterInfo(
             product_id=nvrams["productid"],
@@ -244,88 +488,86 @@ class RouterClient:
 
     def get_netdev(self) -> NetdevInfo:
         response = self.__get_hook("netdev", "appobj")
-        data = json.loads(response)
-        netdev = data["netdev"]
-
-        bridge = ThroughputInfo(
-            total_upload_bytes=parse_hex(netdev["BRIDGE_tx"]),
-            total_download_bytes=parse_hex(netdev["BRIDGE_rx"])
-        )
-
-        wired = ThroughputInfo(
-            total_upload_bytes=parse_hex(netdev["WIRED_tx"]),
-            total_download_bytes=parse_hex(netdev["WIRED_rx"])
+        return self._parse_netdev(_json.loads(response)["netdev"])
+
+    def _parse_netdev(self, netdev: dict[str, str]) -> NetdevInfo:
+        layout = self._netdev_layout
+        # compare the whole key set: an interface can appear while another key disappears
+        if layout is None or netdev.keys() != layout.keys:
+            layout = self._netdev_layout = _NetdevLayout.scan(netdev)
+        return layout.read(netdev)
+
+    def snapshot(self) -> RouterSnapshot:
+        """
+        Fetch the per-scrape counters (CPU, memory, netdev) with a single appGet.cgi request.
+        The core temperature lives on a separate endpoint, so it is fetched concurrently.
+        """
+        f_temp = self._pool.submit(self.get_core_temp)
+        if not self._split_snapshot:
+            response = self.__get_hooks("cpu_usage()", "memory_usage()", "netdev(appobj)")
+            try:
+                data = _json.loads(response)
+                cpu = self._parse_cpu_usage(data["cpu_usage"])
+                memory = self._parse_memory_usage(data["memory_usage"])
+                netdev = self._parse_netdev(data["netdev"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Combined cpu/memory/netdev hook unusable ({e!r}), using one request per hook")
+                self._split_snapshot = True
+        if self._split_snapshot:
+            # Firmware that does not combine these hooks cleanly: one request per hook
+            cpu = self.get_cpu_usage()
+            memory = self.get_memory_usage()
+            netdev = self.get_netdev()
+        temp_error = f_temp.exception()
+        return RouterSnapshot(
+            cpu=cpu,
+            memory=memory,
+            netdev=netdev,
+            temperature=f_temp.result() if temp_error is None else None,
+            temperature_error=temp_error,
         )
 
-        internet_ids = ids_for("INTERNET", netdev.keys())
-        internet: dict[int, ThroughputInfo] = {
-            iid: ThroughputInfo(
-                total_upload_bytes=parse_hex(netdev.get(f"INTERNET{iid}_tx")),
-                total_download_bytes=parse_hex(netdev.get(f"INTERNET{iid}_rx")),
-            )
-            for iid in internet_ids
-        }
-
-        wireless_ids = ids_for("WIRELESS", netdev.keys())
-        wireless: dict[int, ThroughputInfo] = {
-            wid: ThroughputInfo(
-                total_upload_bytes=parse_hex(netdev.get(f"WIRELESS{wid}_tx")),
-                total_download_bytes=parse_hex(netdev.get(f"WIRELESS{wid}_rx")),
-            )
-            for wid in wireless_ids
-        }
-
-        return NetdevInfo(bridge=bridge, internet=internet, wired=wired, wireless=wireless)
-
+    @_ttl_cache(CAPS_CACHE_TTL)
     def get_supported_features(self) -> RouterFeatureCapabilities:
+        # Capabilities only change on firmware upgrade, so reuse them across calls for a while
         response = self.__get_hook("get_ui_support")
-        data = json.loads(response)
+        data = _json.loads(response)
         cap = RouterFeatureCapabilities(data["get_ui_support"])
         return cap
 
     def get_sw_mode(self) -> SwMode:
-        nvrams = self.__get_nvram("sw_mode", "wlc_psta", "wlc_express")
+        return self._compute_sw_mode(self.get_all_nvrams(_SW_MODE_NVRAMS))
+
+    @staticmethod
+    def _compute_sw_mode(nvrams: dict[str, str]) -> SwMode:
         sw_mode = int(nvrams["sw_mode"])
         wlc_psta = safe_int(nvrams.get("wlc_psta", 0))
         wlc_express = safe_int(nvrams.get("wlc_express", 0))
 
-        mode = SwMode.RT
-        if ((sw_mode == 2 and wlc_psta == 0) or (sw_mode == 3 and wlc_psta == 2)) and wlc_express == 0:
-            # Repeater
-            mode = SwMode.RE
-        elif sw_mode == 3 and (wlc_psta == 0 or wlc_psta == ""):
-            # Access Point
-            mode = SwMode.AP
-        elif (
-                (sw_mode == 3 and wlc_psta in (1, 3) and wlc_express == 0)
-                or (sw_mode == 2 and wlc_psta == 1 and wlc_express == 0)
-        ):
-            # Media Bridge
-            mode = SwMode.MB
-        elif sw_mode == 2 and wlc_psta == 0 and wlc_express == 1:
-            # ExpressWay 2G
-            mode = SwMode.EW2
-        elif sw_mode == 2 and wlc_psta == 0 and wlc_express == 2:
-            # ExpressWay 5G
-            mode = SwMode.EW5
-        elif sw_mode == 5:
-            # Hotspot
-            mode = SwMode.HS
-
-        return mode
+        return (_SW_MODE_TABLE.get((sw_mode, wlc_psta, wlc_express))
+                or _SW_MODE_TABLE.get((sw_mode, wlc_psta, None))
+                or _SW_MODE_TABLE.get((sw_mode, None, None), SwMode.RT))
 
-    def get_dual_wan_info(self) -> DualWanInfo:
-        nvrams = self.__get_nvram("wans_dualwan", "wan0_enable", "wan1_enable", "wans_mode")
-        active_wan_unit = int(json.loads(self.__get_hook("get_wan_unit"))["get_wan_unit"])
-        caps = self.get_supported_features()
+    def __get_active_wan_unit(self) -> int:
+        return int(_json.loads(self.__get_hook("get_wan_unit"))["get_wan_unit"])
 
-        wans_dualwan_raw = nvrams["wans_dualwan"].split()
-        wans_dualwan: dict[int, DualWanOrigin] = {
-            i: DualWanOrigin(part.lower()) if part.lower() in DualWanOrigin._value2member_map_ else DualWanOrigin.NONE
-            for i, part in enumerate(wans_dualwan_raw)
-        }
+    def get_dual_wan_info(self) -> DualWanInfo:
+        f_caps = self._pool.submit(self.get_supported_features)
+        f_wan_unit = self._pool.submit(self.__get_active_wan_unit)
+        nvrams = self.get_all_nvrams(_DUAL_WAN_NVRAMS)
+        return self._compute_dual_wan(nvrams, f_wan_unit.result(), f_caps.result())
 
-        dualwan_enabled = caps.is_supported("dualwan") and DualWanOrigin.NONE not in set(wans_dualwan.values())
+    @staticmethod
+    def _compute_dual_wan(nvrams: dict[str, str], active_wan_unit: int,
+                          caps: RouterFeatureCapabilities) -> DualWanInfo:
+        wans_dualwan: dict[int, DualWanOrigin] = {}
+        has_none = False
+        for i, part in enumerate(nvrams["wans_dualwan"].split()):
+            origin = _DUALWAN_MAP.get(part.lower(), DualWanOrigin.NONE)
+            has_none |= origin is DualWanOrigin.NONE
+            wans_dualwan[i] = origin
+
+        dualwan_enabled = caps.is_supported("dualwan") and not has_none
         return DualWanInfo(
             wan_origins=wans_dualwan,
             wan0_enable=to_bool(nvrams.get("wan0_enable", "0")),
@@ -336,8 +578,10 @@ class RouterClient:
         )
 
     def get_wan_connection_info(self, wan_index: int = 0) -> WanConnectionInfo:
-        nvrams = self.__get_nvram(f"wan{wan_index}_state_t", f"wan{wan_index}_sbstate_t",
-                                  f"wan{wan_index}_auxstate_t", "link_internet")
+        return self._compute_wan_connection(self.get_all_nvrams(_wan_nvrams(wan_index)), wan_index)
+
+    @staticmethod
+    def _compute_wan_connection(nvrams: dict[str, str], wan_index: int) -> WanConnectionInfo:
         return WanConnectionInfo(
             state=WanState(int(nvrams[f"wan{wan_index}_state_t"])),
             substate=WanSubState(int(nvrams[f"wan{wan_index}_sbstate_t"])),
@@ -346,15 +590,25 @@ class RouterClient:
         )
 
     def get_dsl_info(self) -> DslInfo:
-        nvrams = self.__get_nvram("dsl0_proto", "dslx_transmode")
+        return self._compute_dsl(self.get_all_nvrams(_DSL_NVRAMS))
+
+    @staticmethod
+    def _compute_dsl(nvrams: dict[str, str]) -> DslInfo:
         return DslInfo(
             proto=WanDslProtoType(nvrams["dsl0_proto"]),
             transmode=DslTransMode(nvrams["dslx_transmode"]),
         )
 
     def get_wan_info(self, wan_index: int = 0) -> WanInfo:
-        dual_wan_info = self.get_dual_wan_info()
-        wan_connection_info = self.get_wan_connection_info(wan_index)
+        nvrams = self.get_all_nvrams((*_DUAL_WAN_NVRAMS, *_wan_nvrams(wan_index), *_DSL_NVRAMS))
+        caps = self.get_supported_features()
+        dual_wan_info = self._compute_dual_wan(nvrams, self.__get_active_wan_unit(), caps)
+        return self._compute_wan(nvrams, wan_index, dual_wan_info, caps)
+
+    @classmethod
+    def _compute_wan(cls, nvrams: dict[str, str], wan_index: int, dual_wan_info: DualWanInfo,
+                     caps: RouterFeatureCapabilities) -> WanInfo:
+        wan_connection_info = cls._compute_wan_connection(nvrams, wan_index)
         status = WanStatus.CONNECTED if wan_connection_info.is_connected else WanStatus.DISCONNECTED
         if (dual_wan_info.enabled
                 and dual_wan_info.active_wan_unit != wan_index
@@ -363,36 +617,38 @@ class RouterClient:
         wan_info = WanInfo(status=status,
                            connection_info=wan_connection_info,
                            active=dual_wan_info.active_wan_unit == wan_index)
-        caps = self.get_supported_features()
         if status == WanStatus.CONNECTED:
-            nvrams = self.__get_nvram(f"wan{wan_index}_ipaddr", f"wan{wan_index}_proto")
             wan_info.ipaddr = nvrams[f"wan{wan_index}_ipaddr"]
             wan_info.proto = WanProtoType(nvrams[f"wan{wan_index}_proto"])
             wan_origin = dual_wan_info.wan_origins[wan_index]
             if caps.is_supported("usbX") and wan_origin == DualWanOrigin.USB:
                 wan_info.proto = WanProtoType.USB
             elif caps.is_supported("dsl") and wan_origin == DualWanOrigin.DSL:
-                dsl_info = self.get_dsl_info()
+                dsl_info = cls._compute_dsl(nvrams)
                 if (dsl_info.transmode == DslTransMode.ATM
                         and dsl_info.proto in [WanDslProtoType.IPoA, WanDslProtoType.PPPoA]):
                     wan_info.proto = WanProtoType(dsl_info.proto.value)
         return wan_info
 
     def get_network_wan_info(self) -> NetworkWanInfo:
-        sw_mode = self.get_sw_mode()
-        nvrams = self.__get_nvram("link_internet")
+        # get_wan_unit is only needed in router mode, but fetching it speculatively overlaps its RTT
+        f_caps = self._pool.submit(self.get_supported_features)
+        f_wan_unit = self._pool.submit(self.__get_active_wan_unit)
+        nvrams = self.get_all_nvrams((*_SW_MODE_NVRAMS, *_DUAL_WAN_NVRAMS, *_wan_nvrams(0), *_wan_nvrams(1),
+                                      *_DSL_NVRAMS, *_LAN_NVRAMS))
+        sw_mode = self._compute_sw_mode(nvrams)
         network_wan_info = NetworkWanInfo(
             mode=sw_mode,
             link_internet=LinkInternet(int(nvrams["link_internet"])),
         )
         if sw_mode == SwMode.RT:
-            network_wan_info.primary_wan = self.get_wan_info(0)
-            dual_wan_info = self.get_dual_wan_info()
+            caps = f_caps.result()
+            dual_wan_info = self._compute_dual_wan(nvrams, f_wan_unit.result(), caps)
             network_wan_info.dual_wan_info = dual_wan_info
+            network_wan_info.primary_wan = self._compute_wan(nvrams, 0, dual_wan_info, caps)
             if dual_wan_info.enabled:
-                network_wan_info.secondary_wan = self.get_wan_info(1)
+                network_wan_info.secondary_wan = self._compute_wan(nvrams, 1, dual_wan_info, caps)
         elif sw_mode == SwMode.AP:
-            nvrams = self.__get_nvram("lan_ipaddr", "lan_proto")
             network_wan_info.lan_info = LanInfo(
                 state=LanState.CONNECTED,
                 ipaddr=nvrams["lan_ipaddr"],
@@ -403,12 +659,11 @@ class RouterClient:
     def get_port_status_infos(self, mac: str) -> list[PortInfo]:
         response = self.session.get(f"{self.host}/get_port_status.cgi",
                                     params={"node_mac": mac},
-                                    headers=ASUS_CLIENT_DEFAULT_HEADERS,
                                     timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
 
         port_infos: list[PortInfo] = []
-        port_info_raw = response.json().get("port_info", {}).get(mac, {})
+        port_info_raw = _json.loads(response.content).get("port_info", {}).get(mac, {})
         for port_id, data in port_info_raw.items():
             port_info = PortInfo(
                 id=port_id,
@@ -430,14 +685,16 @@ class RouterClientFactory:
         self.host = host.rstrip("/")
 
     def auth(self, auth) -> RouterClient:
-        token = base64.b64encode(auth.encode("utf-8")).decode("utf-8")
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        payload = f"login_authorization={token}"
+        payload = b"login_authorization=" + base64.b64encode(auth.encode("utf-8"))
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2,
+                              pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                              max_retries=Retry(total=DEFAULT_MAX_RETRIES, backoff_factor=0.1))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(ASUS_CLIENT_DEFAULT_HEADERS)
         response = session.post(f"{self.host}/login.cgi",
-                                headers={**ASUS_CLIENT_DEFAULT_HEADERS, **headers},
+                                headers=_AUTH_HEADERS,
                                 data=payload,
                                 timeout=DEFAULT_TIMEOUT)
 
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, tzinfo, time
 from enum import Enum, IntFlag
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemperatureInfo:
     cpu: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CpuInfo:
     total: int
     usage: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryInfo:
     """Memory statistics from router (all values in kilobytes)."""
     total_kb: int
@@ -25,12 +25,12 @@ class MemoryInfo:
     free_kb: int
     """Free memory in kilobytes."""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UptimeInfo:
     systime: datetime
     boottime: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RebootScheduleConf:
     weekday_mask: int
     """
@@ -38,33 +38,62 @@ class RebootScheduleConf:
     """
     hh: int
     mm: int
+    _weekdays: tuple[bool, ...] = field(init=False, repr=False, compare=False)
+    _weekday_bits: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The mask never changes, so expand it into a per-weekday table once
+        weekdays = tuple(((self.weekday_mask >> (6 - (w + 1) % 7)) & 1) == 1 for w in range(7))
+        object.__setattr__(self, "_weekdays", weekdays)
+        object.__setattr__(self, "_weekday_bits", sum(1 << w for w, on in enumerate(weekdays) if on))
+
+    @property
+    def weekday_bits(self) -> int:
+        """
+        Enabled weekdays as a bit-mask in Python order, bit 0=Monday ... bit 6=Sunday.
+        """
+        return self._weekday_bits
 
     def is_weekday_enabled(self, weekday: int) -> bool:
-        weekday_index_asus = (weekday + 1) % 7
-        return ((self.weekday_mask >> (6 - weekday_index_asus)) & 1) == 1
+        return self._weekdays[weekday]
 
     def set_time(self, dt: datetime) -> datetime:
         return dt.replace(hour=self.hh, minute=self.mm, second=0, microsecond=0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RebootScheduleInfo:
     next_at: datetime
     until_ms: int
     schedule: RebootScheduleConf
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThroughputInfo:
     total_upload_bytes: int
     total_download_bytes: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetdevInfo:
     bridge: ThroughputInfo
-    internet: dict[int, ThroughputInfo]
+    internet: list[ThroughputInfo]
     wired: ThroughputInfo
-    wireless: dict[int, ThroughputInfo]
+    wireless: list[ThroughputInfo]
+    internet_ids: tuple[int, ...]
+    """Interface id of each entry in ``internet``."""
+    wireless_ids: tuple[int, ...]
+    """Interface id of each entry in ``wireless``."""
+
+@dataclass(slots=True, frozen=True)
+class RouterSnapshot:
+    """Counters that change on every scrape, fetched together."""
+    cpu: list[CpuInfo]
+    memory: MemoryInfo
+    netdev: NetdevInfo
+    temperature: Optional[TemperatureInfo] = None
+    """None if ajax_coretmp.asp could not be read alongside the counters."""
+    temperature_error: Optional[BaseException] = None
+    """Why ``temperature`` is None, so callers can report it without asking the router again."""
 
 class WifiBand(Enum):
     _2G = 2
@@ -72,7 +101,7 @@ class WifiBand(Enum):
     _6G = 4
     _60G = 6
 
-@dataclass
+@dataclass(slots=True)
 class WifiInfo:
     bands_count: dict[WifiBand, int]
     wps_enabled: bool
@@ -81,9 +110,13 @@ class WifiInfo:
     band_5G_info: Optional[WifiBandInfo] = None
     band_5G_2_info: Optional[WifiBandInfo] = None
     band_6G_info: Optional[WifiBandInfo] = None
+    _supported_bands: frozenset[WifiBand] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._supported_bands = frozenset(b for b, c in self.bands_count.items() if c)
 
     def is_supported(self, b: WifiBand) -> bool:
-        return bool(self.bands_count.get(b, 0))
+        return b in self._supported_bands
 
 class WifiMode(Enum):
     AUTO = 0
@@ -131,7 +164,7 @@ class WifiWpsWep(Enum):
     WEP_64b = 1
     WEP_128b = 2
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WifiBandInfo:
     ssid: str
     mac: str
@@ -150,7 +183,7 @@ class DualWanOrigin(Enum):
     USB = 'usb'
     DSL = 'dsl'
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DualWanInfo:
     wan_origins: dict[int, DualWanOrigin]
     wan0_enable: bool
@@ -167,7 +200,7 @@ class QosType(Enum):
     GEFORCE = 3
     cake = 9
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouterInfo:
     product_id: str
     lan_hwaddr: str
@@ -198,6 +231,7 @@ class RouterFeatureCapabilities:
         self.caps: dict[str, int] = {
             str(k): int(v) for k, v in cap.items()
         }
+        self._supported: frozenset[str] = frozenset(k for k, v in self.caps.items() if v)
 
     def __getitem__(self, key: str) -> int:
         return self.caps.get(key, 0)
@@ -206,7 +240,7 @@ class RouterFeatureCapabilities:
         return key in self.caps
 
     def is_supported(self, f) -> bool:
-        return bool(self.caps.get(f, 0))
+        return f in self._supported
 
 
 class SwMode(Enum):
@@ -282,7 +316,7 @@ class WanMode(Enum):
     FAIL_BACK = "fb"
     LOAD_BALANCE = "lb"
 
-@dataclass
+@dataclass(slots=True)
 class WanInfo:
     status: WanStatus
     connection_info: WanConnectionInfo
@@ -290,7 +324,7 @@ class WanInfo:
     ipaddr: Optional[str] = None
     proto: Optional[WanProtoType] = None
 
-@dataclass
+@dataclass(slots=True)
 class NetworkWanInfo:
     mode: SwMode
     link_internet: LinkInternet
@@ -326,8 +360,9 @@ class LinkInternet(Enum):
     TESTING = 1
     ONLINE = 2
 
+_WAN_CONNECTED_KEY = (LinkInternet.ONLINE, WanState.CONNECTED, WanSubState.OK, WanAuxState.CONNECTED)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WanConnectionInfo:
     state: WanState
     substate: WanSubState
@@ -336,14 +371,9 @@ class WanConnectionInfo:
 
     @property
     def is_connected(self) -> bool:
-        return (
-            self.link_internet == LinkInternet.ONLINE and
-            self.state == WanState.CONNECTED and
-            self.substate == WanSubState.OK and
-            self.auxstate == WanAuxState.CONNECTED
-        )
-
-@dataclass
+        return (self.link_internet, self.state, self.substate, self.auxstate) == _WAN_CONNECTED_KEY
+
+@dataclass(slots=True, frozen=True)
 class DslInfo:
     transmode: DslTransMode
     proto: WanDslProtoType
@@ -359,7 +389,7 @@ class LanProtoType(Enum):
     L2TP = "l2tp"
     PPTP = "pptp"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LanInfo:
     state: LanState
     ipaddr: str
@@ -407,10 +437,9 @@ class EthernetRate(Enum):
 
     @classmethod
     def from_mbps(cls, mbps: int) -> Optional[EthernetRate]:
-        for rate in cls:
-            if rate.mbps == mbps:
-                return rate
-        return None
+        return cls._BY_MBPS.get(mbps)
+
+EthernetRate._BY_MBPS = {r.mbps: r for r in EthernetRate}
 
 
 class UsbRate(Enum):
@@ -428,12 +457,11 @@ class UsbRate(Enum):
 
     @classmethod
     def from_mbps(cls, mbps: int) -> Optional[UsbRate]:
-        for rate in cls:
-            if rate.mbps == mbps:
-                return rate
-        return None
+        return cls._BY_MBPS.get(mbps)
+
+UsbRate._BY_MBPS = {r.mbps: r for r in UsbRate}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortInfo:
     """Detailed info about a single port."""
     id: str
@@ -10,24 +10,18 @@ from __future__ import annotations
 
 import argparse
 import logging
-import math
 import os
-import time
-from dataclasses import dataclass
-from typing import Optional, Dict, Tuple, Iterable, Mapping
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from time import monotonic
+from typing import Optional, Dict, Tuple, Iterable, Mapping, Callable
 
 from prometheus_client import CollectorRegistry, Counter, Info, Gauge, Histogram, start_http_server
 
 import asus_router_client
 
 
-@dataclass
-class ThroughputSample:
-    """Sample of throughput metrics at a point in time."""
-    tx: int
-    rx: int
-
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +31,8 @@ logger = logging.getLogger(__name__)
 
 # Metrics Registry
 registry = CollectorRegistry()
+# The exporter's own health metrics, served even when the router metrics are withheld as stale
+exporter_registry = CollectorRegistry()
 
 # Temperature metrics
 cpu_temp = Gauge(
@@ -328,142 +324,370 @@ ports = {
 scrape_duration_seconds = Histogram(
     "asus_router_scrape_duration_seconds",
     "Time spent scraping router metrics",
-    registry=registry
+    # a scrape is a few router round-trips of tens of ms, up to the 10s request timeout when retrying
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    registry=exporter_registry
 )
 
 scrape_errors_total = Counter(
     "asus_router_scrape_errors_total",
-    "Total number of scrape errors",
-    registry=registry
+    "Total number of scrapes that failed to refresh the router metrics",
+    registry=exporter_registry
+)
+
+scrape_skipped_total = Counter(
+    "asus_router_scrape_skipped_total",
+    "Scrapes that skipped the router because it is in failure cooldown",
+    registry=exporter_registry
+)
+
+# Per-request duration and errors, by scrape job (router_info, snapshot, wan, wireless)
+fetch_duration_seconds = Histogram(
+    "asus_router_fetch_duration_seconds",
+    "Time spent on each router request of a scrape",
+    ["job"],
+    # one router round-trip: tens of ms, up to the 10s request timeout when retrying
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    registry=exporter_registry
+)
+
+fetch_errors_total = Counter(
+    "asus_router_fetch_errors_total",
+    "Total number of failed router requests",
+    ["job"],
+    registry=exporter_registry
+)
+
+router_up = Gauge(
+    "asus_router_up",
+    "Whether the last scrape of the router succeeded (1) or not (0)",
+    registry=exporter_registry
+)
+
+last_success_timestamp_seconds = Gauge(
+    "asus_router_last_success_timestamp_seconds",
+    "Unix time of the last successful scrape of the router",
+    registry=exporter_registry
 )
 
+FETCH_JOBS = ("router_info", "snapshot", "wan", "wireless")
+
+# Router requests issued concurrently per scrape (router info, snapshot, WAN, wireless)
+COLLECT_MAX_WORKERS = 4
+# Scrapes arriving within this many seconds of the last router fetch (e.g. an HA pair of
+# Prometheus servers) are served the same metrics instead of hitting the router again
+SCRAPE_CACHE_TTL = 5.0
+# After this many failed scrapes in a row, leave the router alone for SCRAPE_COOLDOWN seconds
+SCRAPE_MAX_FAILURES = 3
+SCRAPE_COOLDOWN = 60.0
+
 def _b(v: bool | int) -> int:
     """bool/int → 0/1"""
     return 1 if bool(v) else 0
 
-def set_onehot_enum(
+def bind_onehot_enum(
     gauge: Gauge,
     base_labels: Mapping[str, str],
-    enum_values: Iterable,
-    current_value,
+    enum_labels: Iterable[Tuple[object, str]],
     extra_label_name: str,
-    get_label_value=lambda e: getattr(e, "value", getattr(e, "name", str(e))),
-):
-    for e in enum_values:
-        labels = dict(base_labels)
-        labels[extra_label_name] = get_label_value(e)
-        gauge.labels(**labels).set(1 if e == current_value else 0)
-
-def zero_onehot_enum(
-    gauge: Gauge,
-    base_labels: Mapping[str, str],
-    enum_values: Iterable,
-    extra_label_name: str,
-    get_label_value=lambda e: getattr(e, "value", getattr(e, "name", str(e))),
-):
-    for e in enum_values:
-        labels = dict(base_labels)
-        labels[extra_label_name] = get_label_value(e)
-        gauge.labels(**labels).set(0)
-
-def _inc_if_positive(counter_child, delta: int):
-    if delta > 0:
-        counter_child.inc(delta)
+) -> Dict[object, object]:
+    """Resolve the one-hot gauge child of every (enum_value, label_value) pair once: {enum_value: child}."""
+    children = {}
+    labels = dict(base_labels)
+    for e, label_value in enum_labels:
+        labels[extra_label_name] = label_value
+        children[e] = gauge.labels(**labels)
+    return children
+
+def set_onehot_enum(children: Mapping[object, object], current_value):
+    # Enum members are singletons, so identity is enough to find the hot one
+    for e, child in children.items():
+        child.set(1 if e is current_value else 0)
+
+def zero_onehot_enum(children: Mapping[object, object]):
+    for child in children.values():
+        child.set(0)
+
+_ONEHOT_UNSET = object()
+_NAN = float("nan")
+
+# (enum_value, label_value) пары для one-hot, считаются один раз при импорте
+_WAN_MODE_LABELS = tuple((e, e.value) for e in asus_router_client.WanMode)  # "fo"/"fb"/"lb"
+_WAN_AUXSTATE_LABELS = tuple((e, e.name) for e in asus_router_client.WanAuxState)
+_WAN_STATE_LABELS = tuple((e, e.name) for e in asus_router_client.WanState)
+_WAN_SUBSTATE_LABELS = tuple((e, e.name) for e in asus_router_client.WanSubState)
+_WAN_STATUS_LABELS = tuple((e, e.value) for e in asus_router_client.WanStatus)
+_WIFI_MODE_LABELS = tuple((e, e.name) for e in asus_router_client.WifiMode)
+_WIFI_AUTH_MODE_LABELS = tuple((e, e.value) for e in asus_router_client.WifiAuthMode)
+_WIFI_CRYPTO_LABELS = tuple((e, e.value) for e in asus_router_client.WifiCrypto)
+_PORT_GROUP_LABELS = tuple((e, e.name) for e in asus_router_client.PortGroup)
+_SW_MODE_LABELS = tuple((e, e.name) for e in asus_router_client.SwMode)
 
 class _CpuMetricChildren:
     def __init__(self):
         self.temp: Dict[str, any] = {}
-        self.usage: Dict[Tuple[str, str], any] = {}
-        self.total: Dict[Tuple[str, str], any] = {}
-        self.percent: Dict[Tuple[str, str], any] = {}
+        # (product_id, cpu index) -> (usage, total, percent)
+        self.cpu: Dict[Tuple[str, int], Tuple[any, any, any]] = {}
 
     def temp_child(self, product_id: str):
-        c = self.temp.get(product_id)
-        if c is None:
-            c = cpu_temp.labels(product_id=product_id)
-            self.temp[product_id] = c
-        return c
-
-    def usage_child(self, product_id: str, cpu_id: str):
-        key = (product_id, cpu_id)
-        c = self.usage.get(key)
-        if c is None:
-            c = cpu_usage_counter.labels(product_id=product_id, cpu_id=cpu_id)
-            self.usage[key] = c
-        return c
-
-    def total_child(self, product_id: str, cpu_id: str):
-        key = (product_id, cpu_id)
-        c = self.total.get(key)
-        if c is None:
-            c = cpu_total_counter.labels(product_id=product_id, cpu_id=cpu_id)
-            self.total[key] = c
-        return c
-
-    def percent_child(self, product_id: str, cpu_id: str):
-        key = (product_id, cpu_id)
-        c = self.percent.get(key)
-        if c is None:
-            c = cpu_usage_percent_gauge.labels(product_id=product_id, cpu_id=cpu_id)
-            self.percent[key] = c
-        return c
+        try:
+            return self.temp[product_id]
+        except KeyError:
+            c = self.temp[product_id] = cpu_temp.labels(product_id=product_id)
+            return c
+
+    def for_cpu(self, product_id: str, cpu_index: int):
+        key = (product_id, cpu_index)
+        try:
+            return self.cpu[key]
+        except KeyError:
+            cpu_id = str(cpu_index)
+            c = self.cpu[key] = (
+                cpu_usage_counter.labels(product_id=product_id, cpu_id=cpu_id),
+                cpu_total_counter.labels(product_id=product_id, cpu_id=cpu_id),
+                cpu_usage_percent_gauge.labels(product_id=product_id, cpu_id=cpu_id),
+            )
+            return c
 
 class _MemMetricChildren:
     def __init__(self):
-        self.total = {}
-        self.used = {}
-        self.free = {}
-        self.used_pct = {}
+        # product_id -> (total, used, free, used_pct)
+        self.children: Dict[str, Tuple[any, any, any, any]] = {}
 
     def for_pid(self, pid: str):
         # возврат подготовленных childs для данного product_id
-        total = self.total.get(pid)
-        if total is None:
-            total = memory_total_bytes.labels(product_id=pid); self.total[pid] = total
-        used = self.used.get(pid)
-        if used is None:
-            used = memory_used_bytes.labels(product_id=pid); self.used[pid] = used
-        free = self.free.get(pid)
-        if free is None:
-            free = memory_free_bytes.labels(product_id=pid); self.free[pid] = free
-        used_pct = self.used_pct.get(pid)
-        if used_pct is None:
-            used_pct = memory_used_percent.labels(product_id=pid); self.used_pct[pid] = used_pct
-        return total, used, free, used_pct
+        try:
+            return self.children[pid]
+        except KeyError:
+            c = self.children[pid] = (
+                memory_total_bytes.labels(product_id=pid),
+                memory_used_bytes.labels(product_id=pid),
+                memory_free_bytes.labels(product_id=pid),
+                memory_used_percent.labels(product_id=pid),
+            )
+            return c
+
+class _WanChildren:
+    def __init__(self):
+        self.pid: Dict[str, Dict[str, any]] = {}
+        self.unit: Dict[Tuple[str, str], Dict[str, any]] = {}
+
+    def for_pid(self, pid: str) -> Dict[str, any]:
+        try:
+            return self.pid[pid]
+        except KeyError:
+            labels = {"product_id": pid}
+            c = {
+                "dualwan_enabled": wans["dualwan_enabled"].labels(**labels),
+                "dualwan_mode": bind_onehot_enum(wans["dualwan_mode"], labels, _WAN_MODE_LABELS, extra_label_name="mode"),
+                "link_internet": wans["link_internet"].labels(**labels),
+            }
+            self.pid[pid] = c
+            return c
+
+    def for_unit(self, pid: str, unit: str) -> Dict[str, any]:
+        key = (pid, unit)
+        try:
+            return self.unit[key]
+        except KeyError:
+            labels = {"product_id": pid, "unit": unit}
+            c = {
+                "wan_auxstate": bind_onehot_enum(wans["wan_auxstate"], labels, _WAN_AUXSTATE_LABELS, extra_label_name="auxstate"),
+                "wan_state": bind_onehot_enum(wans["wan_state"], labels, _WAN_STATE_LABELS, extra_label_name="state"),
+                "wan_substate": bind_onehot_enum(wans["wan_substate"], labels, _WAN_SUBSTATE_LABELS, extra_label_name="substate"),
+                "wan_status": bind_onehot_enum(wans["wan_status"], labels, _WAN_STATUS_LABELS, extra_label_name="status"),
+                "wan_online": wans["wan_online"].labels(**labels),
+                "wan_active": wans["wan_active"].labels(**labels),
+            }
+            self.unit[key] = c
+            return c
+
+class _WirelessChildren:
+    def __init__(self):
+        self.pid: Dict[str, Tuple[any, any]] = {}
+        self.unit: Dict[Tuple[str, str], Dict[str, any]] = {}
+
+    def for_pid(self, pid: str) -> Tuple[any, any]:
+        try:
+            return self.pid[pid]
+        except KeyError:
+            c = (
+                wireless["wl_wps_enabled"].labels(product_id=pid),
+                wireless["wl_smart_connect_enabled"].labels(product_id=pid),
+            )
+            self.pid[pid] = c
+            return c
+
+    def for_unit(self, pid: str, wl_unit: str) -> Dict[str, any]:
+        key = (pid, wl_unit)
+        try:
+            return self.unit[key]
+        except KeyError:
+            labels = {"product_id": pid, "wl_unit": wl_unit}
+            c = {
+                "wl_band_info": wireless["wl_band_info"].labels(**labels),
+                "wl_ssid_hidden": wireless["wl_ssid_hidden"].labels(**labels),
+                "wl_band_mode": bind_onehot_enum(wireless["wl_band_mode"], labels, _WIFI_MODE_LABELS, extra_label_name="wl_mode"),
+                "wl_auth_mode": bind_onehot_enum(wireless["wl_auth_mode"], labels, _WIFI_AUTH_MODE_LABELS, extra_label_name="wl_auth_mode"),
+                "wl_crypto": bind_onehot_enum(wireless["wl_crypto"], labels, _WIFI_CRYPTO_LABELS, extra_label_name="wl_crypto"),
+            }
+            self.unit[key] = c
+            return c
+
+class _PortChildren:
+    def __init__(self):
+        self.port: Dict[Tuple[str, str], Dict[str, any]] = {}
+
+    def for_port(self, pid: str, port_id: str) -> Dict[str, any]:
+        key = (pid, port_id)
+        try:
+            return self.port[key]
+        except KeyError:
+            labels = {"product_id": pid, "port_id": port_id}
+            c = {
+                "port_plugged": ports["port_plugged"].labels(**labels),
+                "port_max_rate_mbps": ports["port_max_rate_mbps"].labels(**labels),
+                "port_link_rate_mbps": ports["port_link_rate_mbps"].labels(**labels),
+                "port_slow_speed": ports["port_slow_speed"].labels(**labels),
+                "port_group": bind_onehot_enum(ports["port_group"], labels, _PORT_GROUP_LABELS, extra_label_name="port_group"),
+                "port_info": ports["port_info"].labels(**labels),
+            }
+            self.port[key] = c
+            return c
+
+class _RouterChildren:
+    def __init__(self):
+        self.pid: Dict[str, Dict[str, any]] = {}
+
+    def for_pid(self, pid: str) -> Dict[str, any]:
+        try:
+            return self.pid[pid]
+        except KeyError:
+            labels = {"product_id": pid}
+            c = {
+                "uptime": uptime_seconds.labels(**labels),
+                "sw_mode": bind_onehot_enum(router_mode, labels, _SW_MODE_LABELS, extra_label_name="sw_mode"),
+                # bound only while a reboot is scheduled, see _collect_router_info
+                "next_reboot": None,
+                "software_update_available": software_update_available.labels(**labels),
+            }
+            self.pid[pid] = c
+            return c
+
+_NET_COUNTERS = {
+    "bridge": (bridge_tx_bytes, bridge_rx_bytes),
+    "wired": (wired_tx_bytes, wired_rx_bytes),
+    "internet": (internet_tx_bytes, internet_rx_bytes),
+    "wireless": (wireless_tx_bytes, wireless_rx_bytes),
+}
+
+class _NetChildren:
+    def __init__(self):
+        self.children: Dict[Tuple[str, str, Optional[int]], Tuple[any, any]] = {}
+
+    def pair(self, pid: str, interface_type: str, interface_id: Optional[int] = None) -> Tuple[any, any]:
+        """(tx, rx) counter children; bridge/wired have no interface_id label."""
+        key = (pid, interface_type, interface_id)
+        try:
+            return self.children[key]
+        except KeyError:
+            tx_counter, rx_counter = _NET_COUNTERS[interface_type]
+            labels = {"product_id": pid}
+            if interface_id is not None:
+                labels["interface_id"] = str(interface_id)
+            c = (tx_counter.labels(**labels), rx_counter.labels(**labels))
+            self.children[key] = c
+            return c
 
 class RouterMetricsCollector:
-    """Collects metrics from ASUS router and updates Prometheus metrics."""
+    """
+    Collects metrics from ASUS router and updates Prometheus metrics.
 
-    def __init__(self, client: asus_router_client.RouterClient):
-        self.client = client
+    Implements the prometheus_client Collector protocol, so it can be registered in the registry
+    that is served: every /metrics request refreshes the metrics from the router first, so the
+    router is only queried when someone actually scrapes.
+    """
+
+    __slots__ = (
+        "client", "router_info", "_reauth",
+        "_scrape_lock", "_last_collect", "_fresh", "_consecutive_failures", "_cooldown_until",
+        "_cpu_children", "_mem_children", "_wan_children", "_wireless_children",
+        "_net_children", "_port_children", "_router_children",
+        "_pool", "_jobs", "_job_children", "_fetch_info", "_fetch_snapshot", "_onehot_prev", "_gauge_cache", "_info_cache", "_pid", "_debug",
+        "previous_cpu_usage", "previous_cpu_total", "previous_network_tx", "previous_network_rx",
+    )
+
+    def __init__(self, client: asus_router_client.RouterClient,
+                 reauth: Optional[Callable[[], asus_router_client.RouterClient]] = None):
+        """
+        Args:
+            client: Authenticated router client
+            reauth: Logs in again and returns a new client, used when the router rejects the session
+        """
+        self._reauth = reauth
+        # Scrapes mutate the previous-sample state; the HTTP server handles requests in threads
+        self._scrape_lock = threading.Lock()
+        self._last_collect: float | None = None
+        # Whether the last router fetch succeeded; router metrics are only served while it holds
+        self._fresh = False
+        # Circuit breaker state: failed scrapes in a row, and when the router may be queried again
+        self._consecutive_failures = 0
+        self._cooldown_until = 0.0
         self._cpu_children = _CpuMetricChildren()
         self._mem_children = _MemMetricChildren()
+        self._wan_children = _WanChildren()
+        self._wireless_children = _WirelessChildren()
+        self._net_children = _NetChildren()
+        self._port_children = _PortChildren()
+        self._router_children = _RouterChildren()
+        # Overlaps the per-scrape router requests; separate from the client's own pool,
+        # which these calls use internally
+        self._pool = ThreadPoolExecutor(max_workers=COLLECT_MAX_WORKERS)
+        # (duration, errors) children per scrape job
+        self._job_children = {
+            job: (fetch_duration_seconds.labels(job=job), fetch_errors_total.labels(job=job))
+            for job in FETCH_JOBS
+        }
+        self._set_client(client)
+        # Last "hot" member per one-hot group, so unchanged groups are not rewritten every scrape
+        self._onehot_prev: Dict[Tuple[str, ...], object] = {}
+        # Last value written per gauge child (by id), to skip redundant .set() calls
+        self._gauge_cache: Dict[int, float] = {}
+        self._info_cache: Dict[int, Dict[str, str]] = {}
         self.router_info: asus_router_client.RouterInfo | None = None
+        # product_id of router_info, hoisted for the per-scrape collectors
+        self._pid: str = ""
+        self._debug = False
         # Track previous CPU samples for percentage calculation
-        # Format: {cpu_id: {"usage": value, "total": value}}
-        self.previous_cpu_samples = {}
+        # Parallel lists indexed by CPU number: previous_cpu_usage[i], previous_cpu_total[i]
+        self.previous_cpu_usage: list[int] = []
+        self.previous_cpu_total: list[int] = []
         # Track previous network samples for delta calculation
-        # Format: {
-        #     "bridge": ThroughputSample,
-        #     "wired": ThroughputSample,
-        #     "internet": {interface_id: ThroughputSample},
-        #     "wireless": {interface_id: ThroughputSample}
+        # Parallel maps for tx and rx, same shape: {
+        #     "bridge": counter,
+        #     "wired": counter,
+        #     "internet": {interface_id: counter},
+        #     "wireless": {interface_id: counter}
         # }
-        self.previous_network_samples = {}
+        self.previous_network_tx: dict = {}
+        self.previous_network_rx: dict = {}
 
-    def _get_base_labels(self, **extra_labels) -> Dict[str, str]:
+    def _set_onehot(self, group_id: Tuple[str, ...], children: Mapping[object, object], current_value):
         """
-        Get base labels dict with product_id and any extra labels.
-
-        Args:
-            **extra_labels: Additional labels to include (e.g., unit, interface_id)
-
-        Returns:
-            Dict with product_id and extra labels
+        Like set_onehot_enum, but after the first full sweep only flips the members that changed.
+        current_value=None zeroes the whole group.
         """
-        labels = {"product_id": self.router_info.product_id}
-        labels.update(extra_labels)
-        return labels
+        prev = self._onehot_prev.get(group_id, _ONEHOT_UNSET)
+        if prev is _ONEHOT_UNSET:
+            set_onehot_enum(children, current_value)
+        elif prev is current_value:
+            return
+        else:
+            if prev in children:
+                children[prev].set(0)
+            if current_value in children:
+                children[current_value].set(1)
+        self._onehot_prev[group_id] = current_value
 
     @staticmethod
     def _kb_to_bytes(kb: int | float | None) -> float | None:
@@ -474,219 +698,322 @@ class RouterMetricsCollector:
         except Exception:
             return None
 
-    @staticmethod
-    def _calculate_delta(current: int, previous: int) -> int:
-        """
-        Robust delta between two cumulative counters.
-        - Never returns negative.
-        """
-        if current >= previous:
-            return current - previous
-
-        return 0
-
-    @staticmethod
-    def _create_network_samples(netdev_info: asus_router_client.NetdevInfo) -> dict:
+    def _init_network_samples(self, netdev_info: asus_router_client.NetdevInfo) -> None:
         """
         Prepare snapshot of current counters for delta math on next scrape.
         """
-        return {
-            "bridge": ThroughputSample(
-                tx=netdev_info.bridge.total_upload_bytes,
-                rx=netdev_info.bridge.total_download_bytes,
-            ),
-            "wired": ThroughputSample(
-                tx=netdev_info.wired.total_upload_bytes,
-                rx=netdev_info.wired.total_download_bytes,
-            ),
-            "internet": {
-                iid: ThroughputSample(
-                    tx=th.total_upload_bytes,
-                    rx=th.total_download_bytes,
-                ) for iid, th in netdev_info.internet.items()
-            },
-            "wireless": {
-                wid: ThroughputSample(
-                    tx=th.total_upload_bytes,
-                    rx=th.total_download_bytes,
-                ) for wid, th in netdev_info.wireless.items()
-            },
+        self.previous_network_tx = {
+            "bridge": netdev_info.bridge.total_upload_bytes,
+            "wired": netdev_info.wired.total_upload_bytes,
+            "internet": {iid: th.total_upload_bytes for iid, th in zip(netdev_info.internet_ids, netdev_info.internet)},
+            "wireless": {wid: th.total_upload_bytes for wid, th in zip(netdev_info.wireless_ids, netdev_info.wireless)},
+        }
+        self.previous_network_rx = {
+            "bridge": netdev_info.bridge.total_download_bytes,
+            "wired": netdev_info.wired.total_download_bytes,
+            "internet": {iid: th.total_download_bytes for iid, th in zip(netdev_info.internet_ids, netdev_info.internet)},
+            "wireless": {wid: th.total_download_bytes for wid, th in zip(netdev_info.wireless_ids, netdev_info.wireless)},
         }
 
-    def _collect_simple_interface_metrics(self, interface_type: str, current_throughput,
-                                          prev_throughput, tx_counter, rx_counter) -> None:
+    def _collect_simple_interface_metrics(self, interface_type: str, current_throughput) -> None:
         """
         Update metrics for simple interfaces with no sub-interfaces (bridge, wired).
 
         Args:
             interface_type: Type of interface ("bridge" or "wired")
             current_throughput: Current interface throughput data
-            prev_throughput: Previous throughput sample (ThroughputSample)
-            tx_counter: Prometheus counter for transmit bytes
-            rx_counter: Prometheus counter for receive bytes
         """
-        base_labels = self._get_base_labels()
-        delta_tx = self._calculate_delta(current_throughput.total_upload_bytes, prev_throughput.tx)
-        delta_rx = self._calculate_delta(current_throughput.total_download_bytes, prev_throughput.rx)
-        tx_counter.labels(**base_labels).inc(delta_tx)
-        rx_counter.labels(**base_labels).inc(delta_rx)
-        logger.debug(f"[{base_labels['product_id']}] {interface_type.capitalize()}: tx Δ={delta_tx}, rx Δ={delta_rx}")
-
-    def _update_interface_metrics(self, interface_type: str, interfaces: dict,
-                                  prev_interfaces: dict, tx_counter, rx_counter) -> None:
+        pid = self._pid
+        tx = current_throughput.total_upload_bytes
+        rx = current_throughput.total_download_bytes
+        # cumulative counters: a reset/wrap yields a negative difference, which counts as 0
+        delta_tx = tx - self.previous_network_tx[interface_type]
+        delta_tx = delta_tx if delta_tx > 0 else 0
+        delta_rx = rx - self.previous_network_rx[interface_type]
+        delta_rx = delta_rx if delta_rx > 0 else 0
+        # the current counters become the baseline for the next scrape
+        self.previous_network_tx[interface_type] = tx
+        self.previous_network_rx[interface_type] = rx
+        tx_child, rx_child = self._net_children.pair(pid, interface_type)
+        if delta_tx:
+            tx_child.inc(delta_tx)
+        if delta_rx:
+            rx_child.inc(delta_rx)
+        if self._debug:
+            logger.debug(f"[{pid}] {interface_type.capitalize()}: tx Δ={delta_tx}, rx Δ={delta_rx}")
+
+    def _update_interface_metrics(self, interface_type: str, interface_ids, interfaces: list) -> None:
         """
         Update metrics for a specific interface type (internet or wireless).
 
         Args:
             interface_type: Type of interface ("internet" or "wireless")
+            interface_ids: Interface ids, parallel to ``interfaces``
             interfaces: Current interface data from netdev_info
-            prev_interfaces: Previous interface samples
-            tx_counter: Prometheus counter for transmit bytes
-            rx_counter: Prometheus counter for receive bytes
         """
-        base_labels = self._get_base_labels()
-        for interface_id, throughput in interfaces.items():
-            labels = self._get_base_labels(interface_id=str(interface_id))
-            if interface_id in prev_interfaces:
-                prev_iface = prev_interfaces[interface_id]
-                delta_tx = self._calculate_delta(throughput.total_upload_bytes, prev_iface.tx)
-                delta_rx = self._calculate_delta(throughput.total_download_bytes, prev_iface.rx)
+        pid = self._pid
+        debug = self._debug
+        prev_tx = self.previous_network_tx[interface_type]
+        prev_rx = self.previous_network_rx[interface_type]
+        pair = self._net_children.pair
+        for interface_id, throughput in zip(interface_ids, interfaces):
+            tx = throughput.total_upload_bytes
+            rx = throughput.total_download_bytes
+            p_tx = prev_tx.get(interface_id)
+            if p_tx is not None:
+                delta_tx = tx - p_tx
+                delta_tx = delta_tx if delta_tx > 0 else 0
+                delta_rx = rx - prev_rx[interface_id]
+                delta_rx = delta_rx if delta_rx > 0 else 0
             else:
-                logger.debug(f"[{base_labels['product_id']}] {interface_type.capitalize()} interface {interface_id} - first sample, storing baseline")
+                if debug:
+                    logger.debug(f"[{pid}] {interface_type.capitalize()} interface {interface_id} - first sample, storing baseline")
                 delta_tx = 0
                 delta_rx = 0
+            # the current counters become the baseline for the next scrape
+            prev_tx[interface_id] = tx
+            prev_rx[interface_id] = rx
+
+            # children are bound even for zero deltas so new interfaces are exported from the first sample
+            tx_child, rx_child = pair(pid, interface_type, interface_id)
+            if delta_tx:
+                tx_child.inc(delta_tx)
+            if delta_rx:
+                rx_child.inc(delta_rx)
+            if debug:
+                logger.debug(f"[{pid}] {interface_type.capitalize()} {interface_id}: tx Δ={delta_tx}, rx Δ={delta_rx}")
+
+        # forget interfaces that vanished from this sample
+        if len(prev_tx) != len(interface_ids):
+            for interface_id in prev_tx.keys() - set(interface_ids):
+                del prev_tx[interface_id]
+                del prev_rx[interface_id]
+
+    def _set_gauge_cached(self, child, value) -> None:
+        """Set gauge child only if the value differs from what this collector last wrote to it."""
+        v = float(value)
+        key = id(child)
+        prev = self._gauge_cache.get(key)
+        if prev is not None and (prev == v or (prev != prev and v != v)):  # NaN == NaN here
+            return
+        child.set(v)
+        self._gauge_cache[key] = v
 
-            tx_counter.labels(**labels).inc(delta_tx)
-            rx_counter.labels(**labels).inc(delta_rx)
-            logger.debug(f"[{base_labels['product_id']}] {interface_type.capitalize()} {interface_id}: tx Δ={delta_tx}, rx Δ={delta_rx}")
+    def _set_info_cached(self, child, value: Dict[str, str]) -> None:
+        """Info.info() rebuilds its label set each call; only do it when the content changed."""
+        key = id(child)
+        if self._info_cache.get(key) == value:
+            return
+        child.info(value)
+        self._info_cache[key] = value
 
-    @staticmethod
-    def _set_gauge_safe(child, value: float | None):
+    def _set_gauge_safe(self, child, value: float | None):
         """Set gauge value; if None/invalid -> NaN to avoid misleading zeroes."""
+        if value is None:
+            self._set_gauge_cached(child, _NAN)
+            return
         try:
-            child.set(float(value) if value is not None and not math.isnan(value) else float("nan"))
-        except Exception as e:
+            v = float(value)
+        except (TypeError, ValueError) as e:
             logger.warning(f"Failed to set gauge: {e}")
+            v = _NAN
+        self._set_gauge_cached(child, v)
+
+    def _set_client(self, client: asus_router_client.RouterClient) -> None:
+        """Switch to client, rebinding the per-scrape jobs that call it."""
+        self.client = client
+        self._fetch_info = self._timed("router_info", client.get_info)
+        self._fetch_snapshot = self._timed("snapshot", client.snapshot)
+        # (fetch, metric updates fed with its result), fetched concurrently once product_id is known
+        self._jobs = (
+            (self._collect_snapshot, (
+                self._collect_temperature_metrics,
+                self._collect_cpu_metrics,
+                self._collect_memory_metrics,
+                self._collect_network_metrics,
+            )),
+            (self._timed("wan", client.get_network_wan_info), (self._collect_wan_info_metrics,)),
+            (self._timed("wireless", client.get_wireless_info), (self._collect_wireless_metrics,)),
+        )
+
+    def _timed(self, job: str, fetch: Callable[[], object]) -> Callable[[], object]:
+        """Wrap fetch to record its duration and failures under job."""
+        duration, errors = self._job_children[job]
+
+        def run():
+            with duration.time():
+                try:
+                    return fetch()
+                except Exception:
+                    errors.inc()
+                    raise
+
+        return run
+
+    def close(self) -> None:
+        """Stop the collector pool and close the router client."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+    def _refresh(self) -> None:
+        """Collect all metrics, logging in again once if the router rejected the session."""
+        try:
+            self.collect_all_metrics()
+        except asus_router_client.AuthenticationException:
+            if self._reauth is None:
+                raise
+            logger.warning("Router rejected the session, logging in again")
+            old_client = self.client
+            self._set_client(self._reauth())
+            old_client.close()
+            self.collect_all_metrics()
+
+    def collect(self) -> Iterable:
+        """
+        Refresh metrics from the router, then yield the router and exporter metrics.
+
+        While the router cannot be reached only the exporter metrics are yielded, so last known
+        router values are not served as if they were current.
+        """
+        # Concurrent scrapes queue on the lock and then find the metrics fresh
+        with self._scrape_lock:
+            now = monotonic()
+            if now < self._cooldown_until:
+                scrape_skipped_total.inc()
+            elif self._last_collect is None or now - self._last_collect >= SCRAPE_CACHE_TTL:
+                try:
+                    # one observation and at most one error per scrape, also when it re-logs in
+                    with scrape_duration_seconds.time():
+                        self._refresh()
+                    self._fresh = True
+                    self._consecutive_failures = 0
+                    router_up.set(1)
+                    last_success_timestamp_seconds.set_to_current_time()
+                except Exception:
+                    # already logged by collect_all_metrics
+                    scrape_errors_total.inc()
+                    self._fresh = False
+                    router_up.set(0)
+                    self._consecutive_failures += 1
+                    if self._consecutive_failures >= SCRAPE_MAX_FAILURES:
+                        logger.warning(f"{self._consecutive_failures} scrapes failed in a row, "
+                                       f"pausing router requests for {SCRAPE_COOLDOWN:.0f}s")
+                        self._cooldown_until = monotonic() + SCRAPE_COOLDOWN
+                        self._consecutive_failures = 0
+                finally:
+                    # stamped when the refresh ends, even on failure: scrapes that queued on the lock
+                    # meanwhile are served its result instead of each retrying a struggling router
+                    self._last_collect = monotonic()
+            if not self._fresh:
+                return exporter_registry.collect()
+        return chain(registry.collect(), exporter_registry.collect())
 
     def collect_all_metrics(self):
         """Collect all available metrics from the router."""
-        with scrape_duration_seconds.time():
-            try:
-                # Collect product_id first as it's used in all metrics
-                self._collect_router_info()
-
-                if not self.router_info.product_id:
+        # Debug f-strings are only built when DEBUG is on; the level can change at runtime, so check per scrape
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+        try:
+            f_info = self._pool.submit(self._fetch_info)
+            if not self._pid:
+                # product_id labels all metrics: until it is known, wait for router info first
+                self._collect_router_info(f_info.result())
+                f_info = None
+                if not self._pid:
                     logger.warning("Product ID not available, skipping metric collection")
                     return
 
-                self._collect_temperature_metrics()
-                self._collect_cpu_metrics()
-                self._collect_memory_metrics()
-                self._collect_network_metrics()
-                self._collect_wan_info_metrics()
-                self._collect_wireless_metrics()
-                self._collect_port_metrics()
-            except Exception as e:
-                logger.error(f"Error collecting metrics: {e}")
-                scrape_errors_total.inc()
-                raise
+            # Independent router round-trips: overlap them, then update metrics in the usual order
+            pending = [(self._pool.submit(fetch), updates) for fetch, updates in self._jobs]
+
+            if f_info is not None:
+                self._collect_router_info(f_info.result())
+            for future, updates in pending:
+                result = future.result()
+                for update in updates:
+                    update(result)
+            self._collect_port_metrics()
+        except Exception as e:
+            logger.error(f"Error collecting metrics: {e}")
+            raise
 
-    def _collect_wan_info_metrics(self):
-        base_labels = self._get_base_labels()
+    def _collect_wan_info_metrics(self, net_wan_info: asus_router_client.NetworkWanInfo):
+        pid = self._pid
+        children = self._wan_children.for_pid(pid)
 
-        net_wan_info = self.client.get_network_wan_info()
-        wans["link_internet"].labels(**base_labels).set(net_wan_info.has_internet)
+        self._set_gauge_cached(children["link_internet"], net_wan_info.has_internet)
 
         dual = net_wan_info.dual_wan_info
         if dual is not None:
-            wans["dualwan_enabled"].labels(**base_labels).set(_b(dual.enabled))
+            self._set_gauge_cached(children["dualwan_enabled"], _b(dual.enabled))
             # one-hot по режимам
-            set_onehot_enum(
-                wans["dualwan_mode"],
-                base_labels,
-                asus_router_client.WanMode,
-                dual.wans_mode,
-                extra_label_name="mode",
-                get_label_value=lambda e: e.value,  # "fo"/"fb"/"lb"
-            )
+            self._set_onehot(("dualwan_mode", pid), children["dualwan_mode"], dual.wans_mode)
         else:
             # не чистим серии, просто обнулим — стабильнее для прометея
-            wans["dualwan_enabled"].labels(**base_labels).set(0)
-            zero_onehot_enum(
-                wans["dualwan_mode"],
-                base_labels,
-                asus_router_client.WanMode,
-                extra_label_name="mode",
-                get_label_value=lambda e: e.value,
-            )
+            self._set_gauge_cached(children["dualwan_enabled"], 0)
+            self._set_onehot(("dualwan_mode", pid), children["dualwan_mode"], None)
 
         # первичный/вторичный WAN
         self._collect_wan_metrics(0, net_wan_info.primary_wan)
         self._collect_wan_metrics(1, net_wan_info.secondary_wan)
 
     def _collect_wan_metrics(self, unit: int, wan_info: Optional[asus_router_client.WanInfo]):
-        base_labels = self._get_base_labels(unit=str(unit))
+        pid = self._pid
+        unit_id = str(unit)
+        children = self._wan_children.for_unit(pid, unit_id)
 
         if wan_info is None:
             # WAN отсутствует: обнулить one-hot и простые gauge
-            zero_onehot_enum(
-                wans["wan_auxstate"], base_labels, asus_router_client.WanAuxState,
-                extra_label_name="auxstate", get_label_value=lambda e: e.name
-            )
-            zero_onehot_enum(
-                wans["wan_state"], base_labels, asus_router_client.WanState,
-                extra_label_name="state", get_label_value=lambda e: e.name
-            )
-            zero_onehot_enum(
-                wans["wan_substate"], base_labels, asus_router_client.WanSubState,
-                extra_label_name="substate", get_label_value=lambda e: e.name
-            )
-            zero_onehot_enum(
-                wans["wan_status"], base_labels, asus_router_client.WanStatus,
-                extra_label_name="status", get_label_value=lambda e: e.value
-            )
-            wans["wan_online"].labels(**base_labels).set(0)
-            wans["wan_active"].labels(**base_labels).set(0)
+            self._set_onehot(("wan_auxstate", pid, unit_id), children["wan_auxstate"], None)
+            self._set_onehot(("wan_state", pid, unit_id), children["wan_state"], None)
+            self._set_onehot(("wan_substate", pid, unit_id), children["wan_substate"], None)
+            self._set_onehot(("wan_status", pid, unit_id), children["wan_status"], None)
+            self._set_gauge_cached(children["wan_online"], 0)
+            self._set_gauge_cached(children["wan_active"], 0)
             return
 
         conn = wan_info.connection_info
 
         # one-hot по enum'ам
-        set_onehot_enum(
-            wans["wan_auxstate"], base_labels, asus_router_client.WanAuxState,
-            conn.auxstate, extra_label_name="auxstate", get_label_value=lambda e: e.name
-        )
-        set_onehot_enum(
-            wans["wan_state"], base_labels, asus_router_client.WanState,
-            conn.state, extra_label_name="state", get_label_value=lambda e: e.name
-        )
-        set_onehot_enum(
-            wans["wan_substate"], base_labels, asus_router_client.WanSubState,
-            conn.substate, extra_label_name="substate", get_label_value=lambda e: e.name
-        )
+        self._set_onehot(("wan_auxstate", pid, unit_id), children["wan_auxstate"], conn.auxstate)
+        self._set_onehot(("wan_state", pid, unit_id), children["wan_state"], conn.state)
+        self._set_onehot(("wan_substate", pid, unit_id), children["wan_substate"], conn.substate)
 
-        wans["wan_online"].labels(**base_labels).set(_b(conn.is_connected))
+        self._set_gauge_cached(children["wan_online"], _b(conn.is_connected))
 
-        set_onehot_enum(
-            wans["wan_status"], base_labels, asus_router_client.WanStatus,
-            wan_info.status, extra_label_name="status", get_label_value=lambda e: e.value
-        )
+        self._set_onehot(("wan_status", pid, unit_id), children["wan_status"], wan_info.status)
 
-        wans["wan_active"].labels(**base_labels).set(_b(wan_info.active))
+        self._set_gauge_cached(children["wan_active"], _b(wan_info.active))
 
-    def _collect_temperature_metrics(self):
+    def _collect_snapshot(self) -> Optional[asus_router_client.RouterSnapshot]:
+        """Fetch CPU, memory and netdev counters in one router round-trip."""
+        pid = self._pid
+        try:
+            return self._fetch_snapshot()
+        except Exception as e:
+            logger.warning(f"[{pid}] CPU/memory/network collection failed: {e}")
+            return None
+
+    def _collect_temperature_metrics(self, snapshot: Optional[asus_router_client.RouterSnapshot]):
         """Collect temperature metrics with logging and safety."""
-        pid = self.router_info.product_id
+        pid = self._pid
         child = self._cpu_children.temp_child(pid)
+        if snapshot is None:
+            # the snapshot failure is already logged
+            self._set_gauge_safe(child, None)
+            return
         try:
-            temp_info = self.client.get_core_temp()
+            temp_info = snapshot.temperature
+            if temp_info is None:
+                # fetched alongside the snapshot; report its failure rather than asking the router again
+                raise snapshot.temperature_error
             self._set_gauge_safe(child, temp_info.cpu)
-            logger.debug(f"[{pid}] CPU temperature: {temp_info.cpu:.1f}°C")
+            if self._debug:
+                logger.debug(f"[{pid}] CPU temperature: {temp_info.cpu:.1f}°C")
         except Exception as e:
             logger.warning(f"[{pid}] CPU temperature collection failed: {e}")
             self._set_gauge_safe(child, None)
 
-    def _collect_cpu_metrics(self):
+    def _collect_cpu_metrics(self, snapshot: Optional[asus_router_client.RouterSnapshot]):
         """Collect CPU usage metrics."""
         """
             Export:
@@ -694,50 +1021,66 @@ class RouterMetricsCollector:
               - asus_router_cpu_usage_percent : Gauge computed from deltas
             Resilient to wraps/resets; clamps percent to [0, 100].
             """
-        pid = self.router_info.product_id
-        try:
-            cpu_infos = self.client.get_cpu_usage()
-        except Exception as e:
-            logger.warning(f"[{pid}] CPU usage collection failed: {e}")
+        pid = self._pid
+        if snapshot is None:
             return
+        debug = self._debug
+        cpu_infos = snapshot.cpu
+        prev_usage = self.previous_cpu_usage
+        prev_total = self.previous_cpu_total
+        n_prev = len(prev_usage)
 
         for i, cpu_info in enumerate(cpu_infos):
-            cpu_id = str(i)
-
-            # store current sample
-            prev = self.previous_cpu_samples.get(cpu_id)
+            usage_child, total_child, percent_child = self._cpu_children.for_cpu(pid, i)
 
             # on subsequent scrapes: compute deltas
-            if prev is not None:
-                du = self._calculate_delta(cpu_info.usage, prev["usage"])
-                dt = self._calculate_delta(cpu_info.total, prev["total"])
-
-                # update counters by deltas only (never set absolute values on Counter)
-                self._cpu_children.usage_child(pid, cpu_id).inc(max(0, du))
-                self._cpu_children.total_child(pid, cpu_id).inc(max(0, dt))
-
+            if i < n_prev:
+                # counter reset/wrap → delta 0
+                du = cpu_info.usage - prev_usage[i]
+                du = du if du > 0 else 0
+                dt = cpu_info.total - prev_total[i]
+                dt = dt if dt > 0 else 0
+
+                # update counters by deltas only (never set absolute values on Counter);
+                # a zero delta would only take the child's lock for nothing
+                if du > 0:
+                    usage_child.inc(du)
                 if dt > 0:
-                    pct = max(0.0, min(100.0, (du / dt) * 100.0))
-                    self._cpu_children.percent_child(pid, cpu_id).set(pct)
-                    logger.debug(f"[{pid}] CPU {cpu_id}: usage Δ={du}, total Δ={dt}, {pct:.1f}%")
+                    total_child.inc(dt)
+                    # du is already clamped to >= 0, so only the upper bound needs checking
+                    pct = (du / dt) * 100.0
+                    if pct > 100.0:
+                        pct = 100.0
+                    self._set_gauge_cached(percent_child, pct)
+                    if debug:
+                        logger.debug(f"[{pid}] CPU {i}: usage Δ={du}, total Δ={dt}, {pct:.1f}%")
                 else:
                     # dt == 0 (no progress / error): set NaN to indicate unknown
-                    self._cpu_children.percent_child(pid, cpu_id).set(float("nan"))
+                    self._set_gauge_cached(percent_child, _NAN)
             else:
                 # first sample: cannot compute deltas yet → set percent NaN
-                self._cpu_children.percent_child(pid, cpu_id).set(float("nan"))
+                self._set_gauge_cached(percent_child, _NAN)
 
-            self.previous_cpu_samples[cpu_id] = {"usage": cpu_info.usage, "total": cpu_info.total}
+        # store current samples
+        self.previous_cpu_usage = [c.usage for c in cpu_infos]
+        self.previous_cpu_total = [c.total for c in cpu_infos]
 
-        logger.debug(f"[{pid}] CPU metrics collected: {len(cpu_infos)} CPUs")
+        if debug:
+            logger.debug(f"[{pid}] CPU metrics collected: {len(cpu_infos)} CPUs")
 
-    def _collect_memory_metrics(self):
+    def _collect_memory_metrics(self, snapshot: Optional[asus_router_client.RouterSnapshot]):
         """Collect memory usage metrics (KB from router -> bytes)."""
-        pid = self.router_info.product_id
+        pid = self._pid
         total_c, used_c, free_c, used_pct_c = self._mem_children.for_pid(pid)
 
+        if snapshot is None:
+            # снапшот не получен (уже залогировано) — NaN, как и при ошибке разбора
+            for child in (total_c, used_c, free_c, used_pct_c):
+                self._set_gauge_safe(child, None)
+            return
+
         try:
-            mem = self.client.get_memory_usage()  # ожидается .total_kb / .used_kb / .free_kb
+            mem = snapshot.memory  # ожидается .total_kb / .used_kb / .free_kb
             total_b = self._kb_to_bytes(mem.total_kb)
             used_b = self._kb_to_bytes(mem.used_kb)
             free_b = self._kb_to_bytes(mem.free_kb)
@@ -753,7 +1096,8 @@ class RouterMetricsCollector:
             else:
                 self._set_gauge_safe(used_pct_c, None)
 
-            logger.debug(f"[{pid}] Memory: total={mem.total_kb}KB, used={mem.used_kb}KB, free={mem.free_kb}KB")
+            if self._debug:
+                logger.debug(f"[{pid}] Memory: total={mem.total_kb}KB, used={mem.used_kb}KB, free={mem.free_kb}KB")
 
         except Exception as e:
             logger.warning(f"[{pid}] Memory collection failed: {e}")
@@ -763,64 +1107,48 @@ class RouterMetricsCollector:
             self._set_gauge_safe(free_c, None)
             self._set_gauge_safe(used_pct_c, None)
 
-    def _collect_network_metrics(self):
+    def _collect_network_metrics(self, snapshot: Optional[asus_router_client.RouterSnapshot]):
         """Collect network throughput metrics.
 
         Export:
           - Network interface counters (bridge, wired, internet, wireless) via tx/rx bytes
           - Resilient to wraps/resets; increments by deltas only
         """
-        pid = self.router_info.product_id
-        try:
-            netdev_info = self.client.get_netdev()
-        except Exception as e:
-            logger.warning(f"[{pid}] Network collection failed: {e}")
+        pid = self._pid
+        if snapshot is None:
             return
+        netdev_info = snapshot.netdev
 
         # Initialize network samples tracking if not present
-        if not self.previous_network_samples:
-            self.previous_network_samples = self._create_network_samples(netdev_info)
-            logger.debug(f"[{pid}] Network samples initialized (first collection)")
+        if not self.previous_network_tx:
+            self._init_network_samples(netdev_info)
+            if self._debug:
+                logger.debug(f"[{pid}] Network samples initialized (first collection)")
             return
 
         # Bridge metrics
-        self._collect_simple_interface_metrics(
-            "bridge", netdev_info.bridge,
-            self.previous_network_samples["bridge"],
-            bridge_tx_bytes, bridge_rx_bytes
-        )
+        self._collect_simple_interface_metrics("bridge", netdev_info.bridge)
 
         # Wired metrics
-        self._collect_simple_interface_metrics(
-            "wired", netdev_info.wired,
-            self.previous_network_samples["wired"],
-            wired_tx_bytes, wired_rx_bytes
-        )
+        self._collect_simple_interface_metrics("wired", netdev_info.wired)
 
         # Internet metrics
-        prev_internet = self.previous_network_samples.get("internet", {})
-        self._update_interface_metrics("internet", netdev_info.internet, prev_internet,
-                                       internet_tx_bytes, internet_rx_bytes)
+        self._update_interface_metrics("internet", netdev_info.internet_ids, netdev_info.internet)
 
         # Wireless metrics
-        prev_wireless = self.previous_network_samples.get("wireless", {})
-        self._update_interface_metrics("wireless", netdev_info.wireless, prev_wireless,
-                                       wireless_tx_bytes, wireless_rx_bytes)
-
-        # Update previous samples for next iteration
-        self.previous_network_samples = self._create_network_samples(netdev_info)
+        self._update_interface_metrics("wireless", netdev_info.wireless_ids, netdev_info.wireless)
 
-        logger.debug(
-            f"[{pid}] Network metrics collected: "
-            f"internet={len(netdev_info.internet)}, "
-            f"wireless={len(netdev_info.wireless)}"
-        )
+        if self._debug:
+            logger.debug(
+                f"[{pid}] Network metrics collected: "
+                f"internet={len(netdev_info.internet)}, "
+                f"wireless={len(netdev_info.wireless)}"
+            )
 
-    def _collect_wireless_metrics(self):
-        base_labels = self._get_base_labels()
-        wireless_info = self.client.get_wireless_info()
-        wireless["wl_wps_enabled"].labels(**base_labels).set(_b(wireless_info.wps_enabled))
-        wireless["wl_smart_connect_enabled"].labels(**base_labels).set(_b(wireless_info.smart_connect_enabled))
+    def _collect_wireless_metrics(self, wireless_info: asus_router_client.WifiInfo):
+        wps_child, smart_connect_child = self._wireless_children.for_pid(self._pid)
+        self._set_gauge_cached(wps_child, _b(wireless_info.wps_enabled))
+        self._set_gauge_cached(smart_connect_child, _b(wireless_info.smart_connect_enabled))
 
         self._collect_wileless_band_metrics(asus_router_client.WifiUnit.WL_2G, wireless_info.band_2G_info)
         self._collect_wileless_band_metrics(asus_router_client.WifiUnit.WL_5G, wireless_info.band_5G_info)
@@ -831,77 +1159,54 @@ class RouterMetricsCollector:
         if wl_unit_info is None:
             return
 
-        base_labels = self._get_base_labels(wl_unit=str(wl_unit.value))
-        wireless["wl_band_info"].labels(**base_labels).info({
+        pid = self._pid
+        unit_id = str(wl_unit.value)
+        children = self._wireless_children.for_unit(pid, unit_id)
+        self._set_info_cached(children["wl_band_info"], {
             "wl_ssid": wl_unit_info.ssid,
             "wl_mac": wl_unit_info.mac,
         })
 
-        wireless["wl_ssid_hidden"].labels(**base_labels).set(_b(wl_unit_info.hidde_ssid))
+        self._set_gauge_cached(children["wl_ssid_hidden"], _b(wl_unit_info.hidde_ssid))
 
-        set_onehot_enum(
-            wireless["wl_band_mode"],
-            base_labels,
-            asus_router_client.WifiMode,
-            wl_unit_info.mode,
-            extra_label_name="wl_mode",
-            get_label_value = lambda e: e.name
-        )
-
-        set_onehot_enum(
-            wireless["wl_auth_mode"],
-            base_labels,
-            asus_router_client.WifiAuthMode,
-            wl_unit_info.auth_mode,
-            extra_label_name="wl_auth_mode",
-            get_label_value=lambda e: e.value
-        )
-
-        set_onehot_enum(
-            wireless["wl_crypto"],
-            base_labels,
-            asus_router_client.WifiCrypto,
-            wl_unit_info.crypto,
-            extra_label_name="wl_crypto",
-            get_label_value=lambda e: e.value
-        )
+        self._set_onehot(("wl_band_mode", pid, unit_id), children["wl_band_mode"], wl_unit_info.mode)
+        self._set_onehot(("wl_auth_mode", pid, unit_id), children["wl_auth_mode"], wl_unit_info.auth_mode)
+        self._set_onehot(("wl_crypto", pid, unit_id), children["wl_crypto"], wl_unit_info.crypto)
 
     def _collect_port_metrics(self):
         """Collect port status and rate metrics."""
-        base_labels = self._get_base_labels()
+        pid = self._pid
 
         if not self.router_info.ports_info:
-            logger.debug(f"[{base_labels['product_id']}] No port info available")
+            if self._debug:
+                logger.debug(f"[{pid}] No port info available")
             return
 
         for port_info in self.router_info.ports_info:
             port_id = port_info.id
-            port_labels = self._get_base_labels(port_id=port_id)
+            children = self._port_children.for_port(pid, port_id)
 
             # Connection status
-            ports["port_plugged"].labels(**port_labels).set(_b(port_info.plugged))
-            ports["port_max_rate_mbps"].labels(**port_labels).set(port_info.max_supported_speed_rate_mbps)
-            ports["port_link_rate_mbps"].labels(**port_labels).set(port_info.current_speed_rate_mbps)
-            ports["port_slow_speed"].labels(**port_labels).set(_b(port_info.is_slow_speed))
-
-            set_onehot_enum(
-                ports["port_group"], port_labels, asus_router_client.PortGroup,
-                port_info.group, extra_label_name="port_group", get_label_value=lambda e: e.name
-            )
+            self._set_gauge_cached(children["port_plugged"], _b(port_info.plugged))
+            self._set_gauge_cached(children["port_max_rate_mbps"], port_info.max_supported_speed_rate_mbps)
+            self._set_gauge_cached(children["port_link_rate_mbps"], port_info.current_speed_rate_mbps)
+            self._set_gauge_cached(children["port_slow_speed"], _b(port_info.is_slow_speed))
 
-            ports["port_info"].labels(**port_labels).info({
+            self._set_onehot(("port_group", pid, port_id), children["port_group"], port_info.group)
+
+            self._set_info_cached(children["port_info"], {
                 "special_port_name": port_info.special_port_name,
             })
 
-    def _collect_router_info(self):
+    def _collect_router_info(self, info: asus_router_client.RouterInfo):
         """Collect router static info and uptime metrics."""
-        info = self.client.get_info()
         self.router_info = info  # store locally for reuse
-        base_labels = self._get_base_labels()
+        self._pid = pid = info.product_id
+        children = self._router_children.for_pid(pid)
 
         # --- Static info ---
         # Assuming info contains fields like product_id, model, fw_version, etc.
-        router_info.info({
+        self._set_info_cached(router_info, {
             "product_id": info.product_id,
             "firmware": f"{info.firmver}_{info.extendno}",
             "serial": info.serial_no,
@@ -910,25 +1215,29 @@ class RouterMetricsCollector:
         })
 
         # --- Uptime ---
-        uptime_seconds.labels(**base_labels).set(info.uptime.boottime)
+        children["uptime"].set(info.uptime.boottime)
 
         # --- SW Mode ---
-        set_onehot_enum(
-            router_mode, base_labels, asus_router_client.SwMode,
-            info.sw_mode, extra_label_name="sw_mode", get_label_value=lambda e: e.name
-        )
+        self._set_onehot(("sw_mode", pid), children["sw_mode"], info.sw_mode)
 
         # --- Next reboot ---
         reboot_schedule = info.reboot_schedule
         if reboot_schedule and reboot_schedule.until_ms is not None:
-            next_reboot_seconds.labels(**base_labels).set(reboot_schedule.until_ms / 1000)
-            logger.debug(f"[{base_labels['product_id']}] Reboot schedule in {reboot_schedule.until_ms / 1000:.0f}s")
-        else:
-            next_reboot_seconds.labels(**base_labels).set(float("nan"))
+            child = children["next_reboot"]
+            if child is None:
+                child = children["next_reboot"] = next_reboot_seconds.labels(product_id=pid)
+            child.set(reboot_schedule.until_ms / 1000)
+            if self._debug:
+                logger.debug(f"[{pid}] Reboot schedule in {reboot_schedule.until_ms / 1000:.0f}s")
+        elif children["next_reboot"] is not None:
+            # no schedule: drop the series rather than exporting NaN
+            next_reboot_seconds.remove(pid)
+            children["next_reboot"] = None
 
-        software_update_available.labels(**base_labels).set(_b(info.software_update_available))
+        self._set_gauge_cached(children["software_update_available"], _b(info.software_update_available))
 
-        logger.debug(f"[{base_labels['product_id']}] Router info collected successfully")
+        if self._debug:
+            logger.debug(f"[{pid}] Router info collected successfully")
 
 
 def create_app(router_host: str, router_auth: str, metrics_port: int = 8000):
@@ -952,26 +1261,22 @@ def create_app(router_host: str, router_auth: str, metrics_port: int = 8000):
         factory = asus_router_client.RouterClientFactory(router_host)
         client = factory.auth(router_auth)
 
-        # Create metrics collector
-        collector = RouterMetricsCollector(client)
+        # Create metrics collector; it logs in again through the factory when the session expires
+        collector = RouterMetricsCollector(client, reauth=lambda: factory.auth(router_auth))
+        # The collector has no describe(): without this flag name[] queries would never reach it
+        serving_registry = CollectorRegistry(support_collectors_without_names=True)
+        serving_registry.register(collector)
 
-        # Start Prometheus metrics HTTP server
-        start_http_server(metrics_port, registry=registry)
+        # Start Prometheus metrics HTTP server; metrics are collected on each scrape
+        start_http_server(metrics_port, registry=serving_registry)
         logger.info(f"Metrics available at http://localhost:{metrics_port}/metrics")
 
-        # Scrape metrics every 30 seconds
         try:
-            while True:
-                try:
-                    collector.collect_all_metrics()
-                    logger.info("Metrics collected successfully")
-                except Exception as e:
-                    logger.error(f"Error during metrics collection: {e}")
-                    raise
-
-                time.sleep(2)
+            threading.Event().wait()
         except KeyboardInterrupt:
             logger.info("Shutting down exporter")
+        finally:
+            collector.close()
 
     return app
 
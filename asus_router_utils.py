@@ -2,11 +2,14 @@ def parse_hex(s: str) -> int:
     return int(s, 16)
 
 def ids_for(prefix: str, keys) -> list[int]:
+    plen = len(prefix)
     return sorted({
-        int(k[len(prefix):k.index("_")])
+        int(head[plen:])
         for k in keys
-        if k.startswith(prefix) and "_" in k
-    }, key=int)
+        if k.startswith(prefix)
+        for head, sep, _ in (k.partition("_"),)
+        if sep
+    })
 
 def safe_int(value):
     try:
@@ -14,5 +17,8 @@ def safe_int(value):
     except (ValueError, TypeError):
         return 0
 
+_FAST_BOOL = {"0": False, "1": True, "": False, "true": True, "false": False}
+
 def to_bool(s: str) -> bool:
-    return bool(int(s))
\ No newline at end of file
+    v = _FAST_BOOL.get(s)
+    return v if v is not None else bool(int(s))
\ No newline at end of file